@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import time
 import uuid
 from datetime import datetime
 from decimal import Decimal
@@ -20,6 +21,11 @@ POLYMARKET_GAMMA_URL = "https://gamma-api.polymarket.com"
 
 logger = logging.getLogger(__name__)
 
+# In-process cache of account_name -> (account_id, expires_at) so read endpoints
+# can skip the name lookup. Account names are unique and never renamed.
+ACCOUNT_ID_CACHE_TTL_SECONDS = 60.0
+_account_id_cache: dict[str, tuple[uuid.UUID, float]] = {}
+
 
 class CreateAccountRequest(BaseModel):
     account_name: str
@@ -189,6 +195,33 @@ async def get_market_metadata(token_id: str) -> dict | None:
     return None
 
 
+async def resolve_account_id(account_name: str, db: AsyncSession) -> uuid.UUID | None:
+    """
+    Resolve an account name to its account_id.
+    
+    Hits are served from a short-lived in-process cache; misses query only the
+    account_id column. Unknown names are not cached, so a newly created account
+    is visible immediately.
+    """
+    now = time.monotonic()
+    cached = _account_id_cache.get(account_name)
+    if cached and cached[1] > now:
+        return cached[0]
+
+    stmt = select(Account.account_id).where(Account.account_name == account_name)
+    result = await db.execute(stmt)
+    account_id = result.scalar_one_or_none()
+
+    if account_id is not None:
+        _account_id_cache[account_name] = (account_id, now + ACCOUNT_ID_CACHE_TTL_SECONDS)
+    return account_id
+
+
+def invalidate_account_id(account_name: str) -> None:
+    """Drop a cached account_id, e.g. after the account has been (re)created."""
+    _account_id_cache.pop(account_name, None)
+
+
 async def create_account_handler(
     request: CreateAccountRequest, db: AsyncSession
 ) -> CreateAccountResponse:
@@ -209,6 +242,7 @@ async def create_account_handler(
         account = Account(account_name=request.account_name)
         db.add(account)
         await db.commit()
+        invalidate_account_id(request.account_name)
         
         return CreateAccountResponse(account_id=account.account_id)
         
@@ -296,19 +330,17 @@ async def get_positions_handler(
     account_name: str, db: AsyncSession
 ) -> GetPositionsResponse:
     """Get all positions held by an account with enriched market data."""
-    # Find the account by name
-    stmt = select(Account).where(Account.account_name == account_name)
-    result = await db.execute(stmt)
-    account = result.scalar_one_or_none()
+    # Resolve the account by name
+    account_id = await resolve_account_id(account_name, db)
 
-    if not account:
+    if account_id is None:
         raise HTTPException(
             status_code=404,
             detail=f"Account with name '{account_name}' not found"
         )
 
     # Get all positions for this account
-    stmt = select(Position).where(Position.account_id == account.account_id)
+    stmt = select(Position).where(Position.account_id == account_id)
     result = await db.execute(stmt)
     positions = result.scalars().all()
 
@@ -512,12 +544,10 @@ async def get_account_value_history_handler(
 ) -> GetAccountValueHistoryResponse:
     """Get account value history between start_time and end_time."""
     try:
-        # Find the account by name
-        stmt = select(Account).where(Account.account_name == account_name)
-        result = await db.execute(stmt)
-        account = result.scalar_one_or_none()
+        # Resolve the account by name
+        account_id = await resolve_account_id(account_name, db)
 
-        if not account:
+        if account_id is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Account with name '{account_name}' not found"
@@ -527,7 +557,7 @@ async def get_account_value_history_handler(
         stmt = (
             select(AccountValue)
             .where(
-                AccountValue.account_id == account.account_id,
+                AccountValue.account_id == account_id,
                 AccountValue.timestamp >= start_time,
                 AccountValue.timestamp <= end_time,
             )
@@ -546,8 +576,8 @@ async def get_account_value_history_handler(
         ]
 
         return GetAccountValueHistoryResponse(
-            account_id=account.account_id,
-            account_name=account.account_name,
+            account_id=account_id,
+            account_name=account_name,
             start_time=start_time,
             end_time=end_time,
             values=values,
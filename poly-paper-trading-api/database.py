@@ -4,6 +4,7 @@ from collections.abc import AsyncGenerator
 
 from dotenv import load_dotenv
 from google.cloud.sql.connector import Connector
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 load_dotenv()
@@ -14,6 +15,20 @@ DB_USER = os.environ["DB_USER"]
 DB_NAME = os.environ["DB_NAME"]
 DB_PASS = os.environ["DB_PASS"]
 
+# Compiled SQL cache (SQLAlchemy default is 500 entries) and per-connection
+# asyncpg prepared statement cache (SQLAlchemy default is 100 entries).
+QUERY_CACHE_SIZE = 5000
+PREPARED_STATEMENT_CACHE_SIZE = 500
+
+# Connection pool sizing - each Cloud SQL connection costs a full connector
+# handshake, so keep enough warm connections for concurrent requests
+POOL_SIZE = 20
+MAX_OVERFLOW = 30
+POOL_RECYCLE_SECONDS = 1800
+# Connections opened at startup, enough for a full strategy processing fan-out,
+# so the first burst of requests doesn't wait on connector handshakes
+POOL_WARMUP_SIZE = 10
+
 # Global connector instance - initialized in lifespan
 connector: Connector | None = None
 engine = None
@@ -38,9 +53,23 @@ async def init_db():
         )
         return conn
 
+    def creator():
+        # Equivalent to async_creator=getconn, but async_creator always uses the
+        # default prepared statement cache size, so build the adapted connection
+        # ourselves to size it.
+        return engine.sync_engine.dialect.dbapi.connect(
+            async_creator_fn=getconn,
+            prepared_statement_cache_size=PREPARED_STATEMENT_CACHE_SIZE,
+        )
+
     engine = create_async_engine(
         "postgresql+asyncpg://",
-        async_creator=getconn,
+        creator=creator,
+        query_cache_size=QUERY_CACHE_SIZE,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SECONDS,
         echo=True,
     )
     
@@ -48,6 +77,16 @@ async def init_db():
     return engine
 
 
+async def warm_pool(size: int = POOL_WARMUP_SIZE) -> None:
+    """Open pooled connections ahead of the first requests. Call after init_db()."""
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Concurrent checkouts each open their own connection, which then stays pooled
+    await asyncio.gather(*(ping() for _ in range(size)))
+
+
 async def close_db():
     """Close database connection and cleanup resources."""
     global connector, engine
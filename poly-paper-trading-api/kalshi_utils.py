@@ -1,6 +1,8 @@
+import asyncio
 import os
 import base64
 import datetime
+import time
 import uuid
 from datetime import datetime as DateTime
 from decimal import Decimal
@@ -8,7 +10,7 @@ from typing import Optional
 import httpx
 from fastapi import HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
@@ -16,12 +18,27 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidSignature
 from google.cloud import secretmanager
 
+from account_utils import resolve_account_id
 from models.kalshi_account import KalshiAccount
 from models.kalshi_market import KalshiMarket
 from models.account import Account, AccountValue
 from models.position import KalshiPosition
 from models.order import KalshiOrder, KalshiOrderSide, KalshiOrderAction, KalshiOrderType, KalshiOrderStatus
 
+# Shared Kalshi API client - initialized in lifespan so requests reuse pooled
+# keep-alive connections instead of a new TCP + TLS handshake per call
+_kalshi_client: httpx.AsyncClient | None = None
+
+# Short-lived cache of ticker -> (expires_at, raw market data) for read-only views,
+# so dashboards polling the same tickers don't refetch them from Kalshi every time
+KALSHI_MARKET_CACHE_TTL_SECONDS = 2.0
+KALSHI_MARKET_CACHE_MAX_SIZE = 4096
+_kalshi_market_cache: dict[str, tuple[float, dict]] = {}
+
+# Ticker -> in-flight market data fetch covering it, so concurrent callers asking
+# for the same ticker share one Kalshi request
+_kalshi_market_inflight: dict[str, asyncio.Task] = {}
+
 
 class KalshiPositionItem(BaseModel):
     """Simplified position item for API responses"""
@@ -53,6 +70,33 @@ class GetKalshiPositionsPnLResponse(BaseModel):
     total_current_value: Decimal
 
 
+async def init_kalshi_http_client() -> None:
+    """Create the shared Kalshi API client. Must be called from within an async context."""
+    global _kalshi_client
+    _kalshi_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
+async def close_kalshi_http_client() -> None:
+    """Close the shared Kalshi API client and its pooled connections."""
+    global _kalshi_client
+    if _kalshi_client:
+        await _kalshi_client.aclose()
+        _kalshi_client = None
+
+
+def _get_kalshi_client() -> httpx.AsyncClient:
+    """Return the shared Kalshi API client."""
+    if _kalshi_client is None:
+        raise RuntimeError("Kalshi HTTP client not initialized. Call init_kalshi_http_client() first.")
+    return _kalshi_client
+
+
 async def _get_kalshi_account(db: AsyncSession, account_name: str) -> KalshiAccount:
     """
     Retrieve KalshiAccount from database by account name
@@ -223,22 +267,22 @@ async def get_kalshi_account_balance(db: AsyncSession, account_name: str) -> dic
     method = 'GET'
     headers = _get_headers(private_key, account.key_id, method, path)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{base_url}{path}",
-            headers=headers
-        )
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            # Log the error response body for debugging
-            error_detail = response.text
-            print(f"Kalshi API Error (get_kalshi_account_balance): Status {response.status_code}")
-            print(f"Error detail: {error_detail}")
-            print(f"Request URL: {base_url}{path}")
-            print(f"Account: {account_name}, is_demo: {account.is_demo}")
-            raise
-        return response.json()
+    client = _get_kalshi_client()
+    response = await client.get(
+        f"{base_url}{path}",
+        headers=headers
+    )
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        # Log the error response body for debugging
+        error_detail = response.text
+        print(f"Kalshi API Error (get_kalshi_account_balance): Status {response.status_code}")
+        print(f"Error detail: {error_detail}")
+        print(f"Request URL: {base_url}{path}")
+        print(f"Account: {account_name}, is_demo: {account.is_demo}")
+        raise
+    return response.json()
 
 
 async def fetch_market_data_for_tickers(tickers: list[str]) -> dict[str, dict]:
@@ -261,10 +305,49 @@ async def fetch_market_data_for_tickers(tickers: list[str]) -> dict[str, dict]:
     Example:
         market_data = await fetch_market_data_for_tickers(['TICKER1', 'TICKER2'])
         yes_ask_cents = market_data['TICKER1']['yes_ask']  # integer cents
+    
+    Tickers already being fetched by a concurrent call are not requested again;
+    this call waits for that fetch and shares its result.
     """
     if not tickers:
         return {}
     
+    tasks: dict[str, asyncio.Task] = {}
+    missing: list[str] = []
+    for ticker in dict.fromkeys(tickers):
+        task = _kalshi_market_inflight.get(ticker)
+        if task is None:
+            missing.append(ticker)
+        else:
+            tasks[ticker] = task
+    
+    if missing:
+        task = asyncio.create_task(_fetch_market_data_from_kalshi(missing))
+        for ticker in missing:
+            _kalshi_market_inflight[ticker] = task
+            tasks[ticker] = task
+        
+        def _release(done: asyncio.Task, released: list[str] = missing) -> None:
+            for ticker in released:
+                if _kalshi_market_inflight.get(ticker) is done:
+                    del _kalshi_market_inflight[ticker]
+        
+        task.add_done_callback(_release)
+    
+    # Shield so a cancelled caller doesn't cancel a fetch other callers await
+    unique_tasks = list(dict.fromkeys(tasks.values()))
+    results = dict(zip(unique_tasks, await asyncio.gather(*(asyncio.shield(t) for t in unique_tasks))))
+    
+    market_data_map = {}
+    for ticker, task in tasks.items():
+        market = results[task].get(ticker)
+        if market is not None:
+            market_data_map[ticker] = market
+    return market_data_map
+
+
+async def _fetch_market_data_from_kalshi(tickers: list[str]) -> dict[str, dict]:
+    """Request market data for the given tickers from the Kalshi API, 100 at a time."""
     base_url = "https://api.elections.kalshi.com"
     path = '/trade-api/v2/markets'
     
@@ -272,25 +355,60 @@ async def fetch_market_data_for_tickers(tickers: list[str]) -> dict[str, dict]:
     
     # Batch tickers to avoid URL length limits
     batch_size = 100
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for i in range(0, len(tickers), batch_size):
-            batch_tickers = tickers[i:i + batch_size]
+    client = _get_kalshi_client()
+    for i in range(0, len(tickers), batch_size):
+        batch_tickers = tickers[i:i + batch_size]
+        
+        try:
+            params = {'tickers': ','.join(batch_tickers)}
+            response = await client.get(f"{base_url}{path}", params=params, timeout=30.0)
+            response.raise_for_status()
+            data = response.json()
             
-            try:
-                params = {'tickers': ','.join(batch_tickers)}
-                response = await client.get(f"{base_url}{path}", params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Store the complete market data for each ticker
-                for market in data.get('markets', []):
-                    ticker = market.get('ticker')
-                    if ticker:
-                        market_data_map[ticker] = market
-            except Exception as e:
-                # Log error but continue processing other batches
-                print(f"Error fetching market data for batch {i//batch_size}: {str(e)}")
-                continue
+            # Store the complete market data for each ticker
+            for market in data.get('markets', []):
+                ticker = market.get('ticker')
+                if ticker:
+                    market_data_map[ticker] = market
+        except Exception as e:
+            # Log error but continue processing other batches
+            print(f"Error fetching market data for batch {i//batch_size}: {str(e)}")
+            continue
+    
+    return market_data_map
+
+
+async def fetch_cached_market_data_for_tickers(tickers: list[str]) -> dict[str, dict]:
+    """
+    Fetch market data like fetch_market_data_for_tickers, reusing recent results.
+    
+    Market data is cached for KALSHI_MARKET_CACHE_TTL_SECONDS; only tickers without
+    a fresh cached entry are requested from Kalshi. Meant for read-only views -
+    trading decisions should call fetch_market_data_for_tickers directly.
+    """
+    now = time.monotonic()
+    market_data_map: dict[str, dict] = {}
+    missing: list[str] = []
+    for ticker in dict.fromkeys(tickers):
+        cached = _kalshi_market_cache.get(ticker)
+        if cached and cached[0] > now:
+            market_data_map[ticker] = cached[1]
+        else:
+            missing.append(ticker)
+    
+    if not missing:
+        return market_data_map
+    
+    fresh = await fetch_market_data_for_tickers(missing)
+    
+    if len(_kalshi_market_cache) >= KALSHI_MARKET_CACHE_MAX_SIZE:
+        for expired_key in [k for k, (expires_at, _) in _kalshi_market_cache.items() if expires_at <= now]:
+            del _kalshi_market_cache[expired_key]
+    
+    expires_at = time.monotonic() + KALSHI_MARKET_CACHE_TTL_SECONDS
+    for ticker, market in fresh.items():
+        _kalshi_market_cache[ticker] = (expires_at, market)
+        market_data_map[ticker] = market
     
     return market_data_map
 
@@ -386,18 +504,18 @@ async def get_kalshi_positions_pnl_handler(
     path = '/trade-api/v2/markets'
     
     market_data_map = {}
-    async with httpx.AsyncClient() as client:
-        # Batch tickers 100 at a time
-        batch_size = 100
-        for i in range(0, len(tickers), batch_size):
-            batch_tickers = tickers[i:i + batch_size]
-            params = {'tickers': ','.join(batch_tickers)}
-            response = await client.get(f"{base_url}{path}", params=params)
-            response.raise_for_status()
-            data = response.json()
-            for m in data.get('markets', []):
-                market_data_map[m['ticker']] = m
-                
+    client = _get_kalshi_client()
+    # Batch tickers 100 at a time
+    batch_size = 100
+    for i in range(0, len(tickers), batch_size):
+        batch_tickers = tickers[i:i + batch_size]
+        params = {'tickers': ','.join(batch_tickers)}
+        response = await client.get(f"{base_url}{path}", params=params)
+        response.raise_for_status()
+        data = response.json()
+        for m in data.get('markets', []):
+            market_data_map[m['ticker']] = m
+            
     # 4. For each position, calculate cost and P&L
     pnl_items = []
     total_cash_pnl = Decimal("0.00")
@@ -775,12 +893,17 @@ async def create_kalshi_order(
         HTTPException: If account not found, insufficient balance, or invalid parameters
     """
     try:
-        # 1. Get the account by name
-        stmt = select(Account).where(Account.account_name == account_name)
-        result = await db.execute(stmt)
-        account = result.scalar_one_or_none()
+        # 1. Get the account by name. Only limit buys read the balance, so other
+        # orders resolve just the account_id through the short-lived cache
+        if action == "buy" and type == "limit":
+            stmt = select(Account).where(Account.account_name == account_name)
+            result = await db.execute(stmt)
+            account = result.scalar_one_or_none()
+            account_id = account.account_id if account else None
+        else:
+            account_id = await resolve_account_id(account_name, db)
         
-        if not account:
+        if account_id is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Account '{account_name}' not found"
@@ -864,37 +987,40 @@ async def create_kalshi_order(
         if expiration_ts is None:
             expiration_ts = int(DateTime.now().timestamp()) + 300  # 5 minutes
         
-        # 6. Create the order record
-        order = KalshiOrder(
-            account_id=account.account_id,
-            ticker=ticker,
-            side=KalshiOrderSide(side),
-            action=KalshiOrderAction(action),
-            count=count,
-            type=KalshiOrderType(type),
-            status=KalshiOrderStatus.OPEN,
-            price=price_cents,
-            expiration_ts=expiration_ts,
+        # 6. Create the order record with a Core INSERT, returning the generated
+        # ID and timestamp instead of flushing and refreshing an ORM object
+        result = await db.execute(
+            insert(KalshiOrder)
+            .values(
+                account_id=account_id,
+                ticker=ticker,
+                side=KalshiOrderSide(side),
+                action=KalshiOrderAction(action),
+                count=count,
+                type=KalshiOrderType(type),
+                status=KalshiOrderStatus.OPEN,
+                price=price_cents,
+                expiration_ts=expiration_ts,
+            )
+            .returning(KalshiOrder.order_id, KalshiOrder.created_at)
         )
-        
-        db.add(order)
+        order_id, created_at = result.one()
         await db.commit()
-        await db.refresh(order)
         
         # 7. Return success response
         return {
-            "order_id": str(order.order_id),
-            "account_id": str(order.account_id),
-            "ticker": order.ticker,
-            "side": order.side.value,
-            "action": order.action.value,
-            "count": order.count,
-            "type": order.type.value,
-            "status": order.status.value,
-            "price": order.price,
-            "price_dollars": f"{order.price / 100:.2f}",
-            "expiration_ts": order.expiration_ts,
-            "created_at": order.created_at.isoformat(),
+            "order_id": str(order_id),
+            "account_id": str(account_id),
+            "ticker": ticker,
+            "side": side,
+            "action": action,
+            "count": count,
+            "type": type,
+            "status": KalshiOrderStatus.OPEN.value,
+            "price": price_cents,
+            "price_dollars": f"{price_cents / 100:.2f}",
+            "expiration_ts": expiration_ts,
+            "created_at": created_at.isoformat(),
         }
         
     except HTTPException:
@@ -1112,35 +1238,35 @@ async def get_kalshi_markets(
     
     # API might have limits on tickers per request, so batch them (100 at a time)
     batch_size = 100
-    async with httpx.AsyncClient() as client:
-        for i in range(0, len(tickers), batch_size):
-            batch_tickers = tickers[i:i + batch_size]
-            
-            # Build request parameters with comma-separated tickers
-            params = {
-                'tickers': ','.join(batch_tickers)
-            }
-            
-            # No authentication headers needed for public markets endpoint
-            response = await client.get(
-                f"{base_url}{path}",
-                params=params
-            )
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                # Log the error response body for debugging
-                error_detail = response.text
-                print(f"Kalshi API Error (get markets): Status {response.status_code}")
-                print(f"Error detail: {error_detail}")
-                print(f"Request URL: {base_url}{path}")
-                print(f"Request params: {params}")
-                print(f"Batch {i//batch_size + 1}, tickers: {batch_tickers[:5]}..." if len(batch_tickers) > 5 else f"Batch {i//batch_size + 1}, tickers: {batch_tickers}")
-                raise
-            data = response.json()
-            
-            # Accumulate markets from this batch
-            all_markets.extend(data.get('markets', []))
+    client = _get_kalshi_client()
+    for i in range(0, len(tickers), batch_size):
+        batch_tickers = tickers[i:i + batch_size]
+        
+        # Build request parameters with comma-separated tickers
+        params = {
+            'tickers': ','.join(batch_tickers)
+        }
+        
+        # No authentication headers needed for public markets endpoint
+        response = await client.get(
+            f"{base_url}{path}",
+            params=params
+        )
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            # Log the error response body for debugging
+            error_detail = response.text
+            print(f"Kalshi API Error (get markets): Status {response.status_code}")
+            print(f"Error detail: {error_detail}")
+            print(f"Request URL: {base_url}{path}")
+            print(f"Request params: {params}")
+            print(f"Batch {i//batch_size + 1}, tickers: {batch_tickers[:5]}..." if len(batch_tickers) > 5 else f"Batch {i//batch_size + 1}, tickers: {batch_tickers}")
+            raise
+        data = response.json()
+        
+        # Accumulate markets from this batch
+        all_markets.extend(data.get('markets', []))
     
     return {
         'markets': all_markets,
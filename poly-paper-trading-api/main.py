@@ -5,7 +5,8 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from decimal import Decimal
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -32,6 +33,7 @@ from account_utils import (
     get_account_value_history_handler,
     get_balance_handler,
     get_positions_handler,
+    invalidate_account_id,
     set_balance_handler,
     update_account_value_handler,
 )
@@ -49,6 +51,7 @@ from kalshi_utils import (
     SellPositionAtMarketRequest,
     SellPositionAtMarketResponse,
     UpdateKalshiAccountValueResponse,
+    close_kalshi_http_client,
     create_kalshi_account_handler,
     get_filled_kalshi_orders_handler,
     get_kalshi_account_balance,
@@ -56,11 +59,12 @@ from kalshi_utils import (
     get_kalshi_account_value_history_handler,
     get_kalshi_markets,
     get_kalshi_positions_pnl_handler,
+    init_kalshi_http_client,
     process_kalshi_orders_handler,
     sell_position_at_market_handler,
     update_kalshi_account_value_handler,
 )
-from database import close_db, get_db, init_db
+from database import close_db, get_db, init_db, warm_pool
 from models.account import Account, Base
 from models.kalshi_account import KalshiAccount  # noqa: F401 - imported for table creation
 from models.kalshi_market import KalshiMarket  # noqa: F401 - imported for table creation
@@ -70,12 +74,18 @@ from order_utils import (
     GetOpenOrdersResponse,
     PlaceLimitOrderRequest,
     PlaceLimitOrderResponse,
+    PlaceLimitOrdersBatchRequest,
+    PlaceLimitOrdersBatchResponse,
     ProcessOpenOrdersResponse,
     cancel_order_handler,
+    close_http_client,
     get_open_orders_handler,
+    init_http_client,
     place_limit_order_handler,
+    place_limit_orders_batch_handler,
     process_open_orders_handler,
 )
+from price_stream import close_price_stream, init_price_stream
 from strategy_utils import (
     CreateStrategyRequest,
     CreateStrategyResponse,
@@ -88,6 +98,7 @@ from strategy_utils import (
     get_active_strategies_handler,
     process_strategies_handler,
     remove_strategy_handler,
+    stream_process_strategies_handler,
     update_strategy_handler,
 )
 
@@ -102,6 +113,13 @@ async def lifespan(app: FastAPI):
     # Create tables on startup
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # Open pooled connections before traffic arrives
+    await warm_pool()
+    
+    # Open the shared Polymarket and Kalshi HTTP clients and live price stream
+    await init_http_client()
+    await init_kalshi_http_client()
+    await init_price_stream()
     
     # Initialize Cloud Monitoring metrics if running in GCP
     if ENABLE_MONITORING:
@@ -114,10 +132,26 @@ async def lifespan(app: FastAPI):
     if ENABLE_MONITORING:
         from monitoring import shutdown_monitoring
         shutdown_monitoring()
+    await close_price_stream()
+    await close_kalshi_http_client()
+    await close_http_client()
     await close_db()
 
 
-app = FastAPI(lifespan=lifespan)
+# Render responses with orjson instead of the stdlib json encoder
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+
+def _model_json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes with pydantic.
+    
+    Used by endpoints returning large models: FastAPI skips its response_model
+    revalidation and dict conversion for a returned Response, while the
+    decorator's response_model still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
 
 # Add monitoring middleware (must be added before app starts)
 # The middleware itself checks if monitoring is initialized before recording metrics
@@ -200,6 +234,9 @@ async def initialize_accounts(db: AsyncSession = Depends(get_db)) -> InitializeA
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to initialize accounts: {str(e)}")
+
+    for name in created:
+        invalidate_account_id(name)
         
     return InitializeAccountsResponse(
         message="Accounts initialized successfully",
@@ -227,6 +264,19 @@ async def place_limit_order(
     return await place_limit_order_handler(request, db)
 
 
+@app.post("/orders/limit/batch", response_model=PlaceLimitOrdersBatchResponse)
+async def place_limit_orders_batch(
+    request: PlaceLimitOrdersBatchRequest, db: AsyncSession = Depends(get_db)
+) -> PlaceLimitOrdersBatchResponse:
+    """
+    Place many limit orders in a single transaction.
+    
+    Orders are applied in sequence with the same rules as /orders/limit.
+    If any order is rejected, none of the orders are placed.
+    """
+    return await place_limit_orders_batch_handler(request, db)
+
+
 @app.post("/orders/{order_id}/cancel", response_model=CancelOrderResponse)
 async def cancel_order(
     order_id: uuid.UUID, db: AsyncSession = Depends(get_db)
@@ -251,6 +301,7 @@ async def get_open_orders(
 
 @app.post("/orders/process", response_model=ProcessOpenOrdersResponse)
 async def process_open_orders(
+    include_messages: bool = Query(default=False, description="Include a human-readable message for each order result"),
     db: AsyncSession = Depends(get_db),
 ) -> ProcessOpenOrdersResponse:
     """
@@ -263,8 +314,10 @@ async def process_open_orders(
     For SELL orders:
     - Check the bid price from the market
     - If bid price >= limit price, fill the order at the limit price
+    
+    Per-order messages are empty unless include_messages=true.
     """
-    return await process_open_orders_handler(db)
+    return await process_open_orders_handler(db, include_messages)
 
 
 @app.post("/accounts/{account_id}/value", response_model=UpdateAccountValueResponse)
@@ -316,7 +369,7 @@ async def create_strategy(
 @app.get("/strategies/active", response_model=GetActiveStrategiesResponse)
 async def get_active_strategies(
     account_name: str, db: AsyncSession = Depends(get_db)
-) -> GetActiveStrategiesResponse:
+) -> Response:
     """
     Get all active strategies for an account with current market data.
     
@@ -330,7 +383,7 @@ async def get_active_strategies(
     
     This provides a complete view of each strategy's status relative to current market conditions.
     """
-    return await get_active_strategies_handler(account_name, db)
+    return _model_json_response(await get_active_strategies_handler(account_name, db))
 
 
 @app.put("/strategies", response_model=UpdateStrategyResponse)
@@ -378,7 +431,7 @@ async def remove_strategy(
 @app.post("/strategies/process", response_model=ProcessStrategiesResponse)
 async def process_strategies(
     account_name: str, db: AsyncSession = Depends(get_db)
-) -> ProcessStrategiesResponse:
+) -> Response:
     """
     Process all active strategies for an account.
     
@@ -386,9 +439,29 @@ async def process_strategies(
     - If there's an existing position, checks exit rules (take profit, stop loss)
     - If no position, checks entry rules and places buy orders if conditions are met
     
+    A strategy with no position whose entry_max_capital_risk or
+    entry_max_position_shares is not positive can never buy, so it is skipped
+    ("Calculated size is 0") before market data is fetched. Its result carries
+    no bid or ask, and it is reported as skipped even when its market has no
+    prices.
+    
     Strategies are processed in parallel for efficiency.
     """
-    return await process_strategies_handler(account_name, db)
+    return _model_json_response(await process_strategies_handler(account_name, db))
+
+
+@app.post("/strategies/process/stream")
+async def process_strategies_stream(
+    account_name: str, db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Process all active strategies for an account, streaming results.
+    
+    Same processing as /strategies/process, but each ProcessStrategyResult is
+    written as a line of NDJSON as soon as it is ready, instead of waiting for
+    the slowest strategy.
+    """
+    return await stream_process_strategies_handler(account_name, db)
 
 
 class BatchProcessStrategiesResponse(BaseModel):
@@ -398,7 +471,7 @@ class BatchProcessStrategiesResponse(BaseModel):
 @app.post("/strategies/batch_process", response_model=BatchProcessStrategiesResponse)
 async def batch_process_strategies(
     db: AsyncSession = Depends(get_db)
-) -> BatchProcessStrategiesResponse:
+) -> Response:
     """
     Batch process all active strategies for standard accounts.
     Accounts: 'openai', 'gemini', 'claude', 'grok', 'qwen', 'kimi'
@@ -424,7 +497,7 @@ async def batch_process_strategies(
             logging.error(f"Error processing strategies for {name}: {str(e)}")
             continue
             
-    return BatchProcessStrategiesResponse(results=results)
+    return _model_json_response(BatchProcessStrategiesResponse(results=results))
 
 
 @app.get("/accounts/audit", response_model=AuditAccountResponse)
@@ -3,11 +3,12 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Integer, Numeric, String, func
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from models.account import Base
+from models.ids import uuid7
 
 
 class OrderSide(str, enum.Enum):
@@ -23,9 +24,21 @@ class OrderStatus(str, enum.Enum):
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Partial index for the open-order scans - filled and cancelled orders
+        # make up most of the table but are never scanned by status
+        Index("ix_orders_status_open", "status", postgresql_where=text("status = 'OPEN'")),
+        # Per-account open-order lookups stay small as order history grows
+        Index(
+            "ix_orders_account_id_token_id_open",
+            "account_id",
+            "token_id",
+            postgresql_where=text("status = 'OPEN'"),
+        ),
+    )
 
     order_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     account_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("accounts.account_id"), nullable=False, index=True
@@ -64,9 +77,21 @@ class KalshiOrderStatus(str, enum.Enum):
 
 class KalshiOrder(Base):
     __tablename__ = "kalshi_orders"
+    __table_args__ = (
+        # Open-order lookups by account (and ticker/side/action) during strategy
+        # processing; most rows are filled or cancelled and never looked up
+        Index(
+            "ix_kalshi_orders_account_id_ticker_open",
+            "account_id",
+            "ticker",
+            "side",
+            "action",
+            postgresql_where=text("status = 'OPEN'"),
+        ),
+    )
 
     order_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     account_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("accounts.account_id"), nullable=False, index=True
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Numeric, String, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,6 +12,13 @@ from models.strategy import StrategySide
 
 class Position(Base):
     __tablename__ = "positions"
+    __table_args__ = (
+        # Account-first index for per-account position scans. Non-unique: the
+        # primary key already enforces uniqueness of (token_id, account_id)
+        Index("ix_positions_account_id_token_id", "account_id", "token_id"),
+        # Leave room on each page so shares/total_cost updates stay HOT
+        {"postgresql_with": {"fillfactor": 80}},
+    )
 
     token_id: Mapped[str] = mapped_column(
         String(255), primary_key=True
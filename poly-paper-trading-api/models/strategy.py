@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, Integer, Numeric, String, Text, func
+from sqlalchemy import DateTime, Enum, Index, Integer, Numeric, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .account import Base
@@ -16,6 +16,19 @@ class StrategySide(str, enum.Enum):
 
 class Strategy(Base):
     __tablename__ = "strategies"
+    __table_args__ = (
+        # Active-strategy lookups filter on COALESCE(valid_until_utc, 'infinity') > now,
+        # which this index serves with a single range scan per account
+        Index(
+            "ix_strategies_account_name_active_until",
+            "account_name",
+            text("coalesce(valid_until_utc, 'infinity'::timestamptz)"),
+            postgresql_include=["created_at"],
+        ),
+    )
+    # Read server-generated created_at/updated_at back with INSERT ... RETURNING,
+    # so new strategies don't need a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary identifier
     strategy_id: Mapped[str] = mapped_column(
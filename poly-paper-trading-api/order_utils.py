@@ -1,24 +1,93 @@
+import asyncio
+import operator
+import random
+import time
 import uuid
 from decimal import Decimal
 
 import httpx
+import orjson
 from fastapi import HTTPException
-from pydantic import BaseModel
-from sqlalchemy import select
+from pydantic import BaseModel, Field
+from sqlalchemy import bindparam, func, insert, literal_column, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from account_utils import resolve_account_id
 from models.account import Account
+from models.ids import uuid7
 from models.order import Order, OrderSide, OrderStatus
 from models.position import Position
 from models.transaction import Transaction
+from price_stream import get_streamed_prices, subscribe_prices
 
 POLYMARKET_CLOB_URL = "https://clob.polymarket.com"
 
+# Shared Polymarket CLOB client - initialized in lifespan so requests reuse
+# pooled keep-alive connections instead of a new TCP + TLS handshake per call
+_client: httpx.AsyncClient | None = None
+
+# Cap on in-flight requests to the CLOB, so bursts queue here instead of
+# tripping Polymarket's rate limits
+POLYMARKET_MAX_CONCURRENT_REQUESTS = 16
+_polymarket_semaphore = asyncio.Semaphore(POLYMARKET_MAX_CONCURRENT_REQUESTS)
+
+# Transient CLOB failures (dropped connections, rate limits, gateway errors) are
+# retried with jittered exponential backoff before failing the request
+POLYMARKET_MAX_ATTEMPTS = 3
+POLYMARKET_RETRY_BASE_DELAY_SECONDS = 0.1
+POLYMARKET_RETRY_MAX_DELAY_SECONDS = 2.0
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# After this many consecutive failed requests, CLOB calls fail fast until the
+# reset timeout passes, instead of piling retries onto a struggling upstream
+POLYMARKET_BREAKER_FAIL_MAX = 10
+POLYMARKET_BREAKER_RESET_SECONDS = 30.0
+
+# Short-lived cache of (token_id, side) -> (expires_at, fetch task). Storing the
+# task rather than the price lets concurrent callers share one in-flight request.
+MARKET_PRICE_CACHE_TTL_SECONDS = 2.0
+MARKET_PRICE_CACHE_MAX_SIZE = 4096
+_market_price_cache: dict[tuple[str, OrderSide], tuple[float, asyncio.Task]] = {}
+
+# Short-lived cache of token_id -> (expires_at, {side: price}) for batch lookups,
+# so back-to-back order processing runs don't refetch the same tokens
+BATCH_PRICE_CACHE_TTL_SECONDS = 1.0
+BATCH_PRICE_CACHE_MAX_SIZE = 4096
+_batch_price_cache: dict[str, tuple[float, dict[str, Decimal]]] = {}
+
+# Single-price lookups that arrive within this window are sent upstream together
+# as one POST /prices request, split into chunks of at most PRICE_BATCH_MAX_SIZE
+PRICE_BATCH_WINDOW_SECONDS = 0.005
+PRICE_BATCH_MAX_SIZE = 500
+
+# Most orders accepted in one batch request; the whole batch locks its account
+# and position rows in a single transaction
+LIMIT_ORDER_BATCH_MAX_SIZE = 500
+
+# Rows fetched per round trip when streaming open orders
+OPEN_ORDERS_YIELD_PER = 500
+
+# Side of the CLOB book an order trades against: BUY orders take the ask
+# (SELL side in the API), SELL orders take the bid (BUY side)
+_API_SIDE = {OrderSide.BUY: "SELL", OrderSide.SELL: "BUY"}
+
+# Whether a market price crosses an order's limit, keyed by order side
+_CROSSES_LIMIT = {OrderSide.BUY: operator.le, OrderSide.SELL: operator.ge}
+
+# Open-order filter with the status inlined rather than bound, so the planner
+# can match the partial indexes on orders even with cached generic plans
+_ORDER_IS_OPEN = Order.status == literal_column(f"'{OrderStatus.OPEN.name}'")
+
+# Shared zero for cost and proceeds accumulators, so hot loops don't re-parse it
+_ZERO = Decimal("0.00")
+
 
 class PlaceLimitOrderRequest(BaseModel):
     account_id: uuid.UUID
-    price: Decimal
-    size: int
+    # Polymarket prices are probabilities quoted in dollars
+    price: Decimal = Field(ge=0, le=1)
+    size: int = Field(gt=0)
     side: OrderSide
     token_id: str
 
@@ -30,6 +99,14 @@ class PlaceLimitOrderResponse(BaseModel):
     message: str
 
 
+class PlaceLimitOrdersBatchRequest(BaseModel):
+    orders: list[PlaceLimitOrderRequest] = Field(min_length=1, max_length=LIMIT_ORDER_BATCH_MAX_SIZE)
+
+
+class PlaceLimitOrdersBatchResponse(BaseModel):
+    results: list[PlaceLimitOrderResponse]
+
+
 class CancelOrderResponse(BaseModel):
     order_id: uuid.UUID
     status: str
@@ -65,32 +142,253 @@ class ProcessOpenOrdersResponse(BaseModel):
     results: list[ProcessedOrderResult]
 
 
+async def init_http_client() -> None:
+    """Create the shared Polymarket CLOB client. Must be called from within an async context."""
+    global _client
+    _client = httpx.AsyncClient(
+        base_url=POLYMARKET_CLOB_URL,
+        transport=httpx.AsyncHTTPTransport(
+            # Concurrent price fetches multiplex over one connection when the CLOB
+            # negotiates HTTP/2; falls back to pooled HTTP/1.1 otherwise
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30.0,
+            ),
+            # Retry failed connection attempts before they reach _post_prices
+            retries=2,
+        ),
+        timeout=httpx.Timeout(10.0, connect=2.0),
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared Polymarket CLOB client and its pooled connections."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
+
+class PriceBatcher:
+    """
+    Coalesces concurrent single-price lookups into batched POST /prices calls.
+    
+    The first lookup in a window schedules a flush; lookups arriving before it
+    runs join the same batch, and each caller gets its price through a future.
+    Pending state is only touched between awaits, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        window: float = PRICE_BATCH_WINDOW_SECONDS,
+        max_size: int = PRICE_BATCH_MAX_SIZE,
+    ):
+        self._window = window
+        self._max_size = max_size
+        self._pending: dict[tuple[str, str], asyncio.Future] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def get(self, token_id: str, api_side: str) -> Decimal:
+        """Get the price for a token on the given Polymarket API side."""
+        key = (token_id, api_side)
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush())
+        # Shield so a cancelled caller doesn't fail the lookup for everyone else
+        return await asyncio.shield(future)
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self._window)
+        batch, self._pending = self._pending, {}
+        self._flush_task = None
+        
+        keys = list(batch)
+        chunks = [keys[i:i + self._max_size] for i in range(0, len(keys), self._max_size)]
+        await asyncio.gather(*(self._send(chunk, batch) for chunk in chunks))
+
+    async def _send(
+        self, keys: list[tuple[str, str]], batch: dict[tuple[str, str], asyncio.Future]
+    ) -> None:
+        try:
+            data = await _post_prices(
+                [{"token_id": token_id, "side": api_side} for token_id, api_side in keys]
+            )
+        except Exception as e:
+            for key in keys:
+                if not batch[key].done():
+                    batch[key].set_exception(e)
+            return
+        
+        for token_id, api_side in keys:
+            future = batch[(token_id, api_side)]
+            if future.done():
+                continue
+            price = data.get(token_id, {}).get(api_side)
+            if price is None:
+                future.set_exception(HTTPException(
+                    status_code=502,
+                    detail=f"Polymarket returned no {api_side} price for token {token_id}"
+                ))
+            else:
+                # str() keeps a numeric price exact by going through its shortest repr
+                future.set_result(Decimal(str(price)))
+
+
+_price_batcher = PriceBatcher()
+
+
+class CircuitBreaker:
+    """
+    Fails upstream calls fast after repeated failures.
+    
+    After fail_max consecutive failures the breaker opens and rejects calls for
+    reset_timeout seconds. The first call after that goes through as a probe:
+    a success closes the breaker, a failure keeps it open for another timeout.
+    """
+
+    def __init__(
+        self,
+        fail_max: int = POLYMARKET_BREAKER_FAIL_MAX,
+        reset_timeout: float = POLYMARKET_BREAKER_RESET_SECONDS,
+    ):
+        self._fail_max = fail_max
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._open_until = 0.0
+
+    def check(self) -> None:
+        """Raise a 503 if the breaker is open, otherwise allow the call."""
+        if self._failures < self._fail_max:
+            return
+        now = time.monotonic()
+        if now < self._open_until:
+            raise HTTPException(
+                status_code=503,
+                detail="Polymarket is unavailable after repeated failures, try again shortly"
+            )
+        # Let this call through as the probe, holding off everyone else meanwhile
+        self._open_until = now + self._reset_timeout
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self._fail_max:
+            self._open_until = time.monotonic() + self._reset_timeout
+
+
+_polymarket_breaker = CircuitBreaker()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Polymarket CLOB client."""
+    if _client is None:
+        raise RuntimeError("HTTP client not initialized. Call init_http_client() first.")
+    return _client
+
+
 async def get_market_price(token_id: str, side: OrderSide) -> Decimal:
     """
     Get the current market price for a token from Polymarket CLOB API.
     
     For BUY orders, we need the ASK price (what sellers are asking).
     For SELL orders, we need the BID price (what buyers are bidding).
+    
+    Prices come from the live price stream while it has a recent book for the token.
+    Until then they are cached for MARKET_PRICE_CACHE_TTL_SECONDS, and
+    concurrent calls for the same token and side share a single upstream request.
     """
+    streamed = get_streamed_prices(token_id)
+    if streamed is not None and (price := streamed.get(_API_SIDE[side])) is not None:
+        return price
+    subscribe_prices((token_id,))
+    
+    key = (token_id, side)
+    now = time.monotonic()
+    cached = _market_price_cache.get(key)
+    
+    if cached and cached[0] > now:
+        task = cached[1]
+    else:
+        if len(_market_price_cache) >= MARKET_PRICE_CACHE_MAX_SIZE:
+            for expired_key in [k for k, (expires_at, _) in _market_price_cache.items() if expires_at <= now]:
+                del _market_price_cache[expired_key]
+        task = asyncio.create_task(_fetch_market_price(token_id, side))
+        _market_price_cache[key] = (now + MARKET_PRICE_CACHE_TTL_SECONDS, task)
+    
+    try:
+        # Shield so a cancelled caller doesn't cancel the fetch other callers await
+        return await asyncio.shield(task)
+    except Exception:
+        # Don't cache failures
+        if _market_price_cache.get(key, (None, None))[1] is task:
+            del _market_price_cache[key]
+        raise
+
+
+async def _fetch_market_price(token_id: str, side: OrderSide) -> Decimal:
+    """Fetch the current market price for a token through the batched /prices lookup."""
     # To get asks (for buying), specify side as SELL
     # To get bids (for selling), specify side as BUY
-    api_side = "SELL" if side == OrderSide.BUY else "BUY"
+    return await _price_batcher.get(token_id, _API_SIDE[side])
+
+
+def _retry_delay(retry: int) -> float:
+    """Jittered exponential backoff before the given retry (1-based)."""
+    delay = min(
+        POLYMARKET_RETRY_MAX_DELAY_SECONDS,
+        POLYMARKET_RETRY_BASE_DELAY_SECONDS * 2 ** (retry - 1),
+    )
+    return random.uniform(delay / 2, delay)
+
+
+async def _post_prices(payload: list[dict[str, str]]) -> dict[str, dict[str, str]]:
+    """
+    Request prices from the Polymarket batch pricing API: POST /prices
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{POLYMARKET_CLOB_URL}/price",
-            params={"token_id": token_id, "side": api_side},
-            timeout=10.0,
+    Returns the raw response, a dict mapping token_id to {side: price}.
+    
+    Connection errors and 429/502/503/504 responses are retried up to
+    POLYMARKET_MAX_ATTEMPTS times; repeated failures open the circuit breaker.
+    """
+    _polymarket_breaker.check()
+    
+    # orjson encodes large payloads much faster than httpx's stdlib json.dumps
+    body = orjson.dumps(payload)
+    for attempt in range(1, POLYMARKET_MAX_ATTEMPTS + 1):
+        if attempt > 1:
+            await asyncio.sleep(_retry_delay(attempt - 1))
+        try:
+            # Hold a semaphore slot only for the request itself, not the backoff
+            async with _polymarket_semaphore:
+                response = await _get_client().post(
+                    "/prices", content=body, headers={"Content-Type": "application/json"}
+                )
+        except httpx.TransportError:
+            if attempt == POLYMARKET_MAX_ATTEMPTS:
+                _polymarket_breaker.record_failure()
+                raise
+            continue
+        if response.status_code not in _RETRYABLE_STATUS_CODES:
+            _polymarket_breaker.record_success()
+            break
+    else:
+        # Still rate limited or failing after the last attempt
+        _polymarket_breaker.record_failure()
+    
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=502,
+            detail=f"Failed to get market prices from Polymarket: {response.text}"
         )
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=502,
-                detail=f"Failed to get market price from Polymarket: {response.text}"
-            )
-        
-        data = response.json()
-        return Decimal(data["price"])
+    
+    return orjson.loads(response.content)
 
 
 async def place_limit_order_handler(
@@ -109,29 +407,18 @@ async def place_limit_order_handler(
     - If limit price <= market price, fill immediately at market price
     - Otherwise, create an open order
     
-    Note: Uses SELECT ... FOR UPDATE to lock the account row and prevent
-    race conditions when multiple strategies place orders concurrently.
+    Note: Balances and shares are checked and updated with single conditional
+    UPDATE statements instead of SELECT ... FOR UPDATE followed by a write, to
+    prevent race conditions when multiple strategies place orders concurrently.
     """
     try:
-        # Get current market price BEFORE acquiring the lock to minimize lock hold time
+        # Get current market price BEFORE touching any rows to minimize lock hold time
         market_price = await get_market_price(request.token_id, request.side)
         
-        # Get the account with row-level lock to prevent concurrent modifications
-        # This ensures balance read and update happen atomically
-        stmt = select(Account).where(Account.account_id == request.account_id).with_for_update()
-        result = await db.execute(stmt)
-        account = result.scalar_one_or_none()
-        
-        if not account:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Account with id '{request.account_id}' not found"
-            )
-        
         if request.side == OrderSide.BUY:
-            return await _handle_buy_order(request, account, market_price, db)
+            return await _handle_buy_order(request, market_price, db)
         else:
-            return await _handle_sell_order(request, account, market_price, db)
+            return await _handle_sell_order(request, market_price, db)
             
     except HTTPException:
         await db.rollback()
@@ -145,71 +432,103 @@ async def place_limit_order_handler(
 
 async def _handle_buy_order(
     request: PlaceLimitOrderRequest,
-    account: Account,
     market_price: Decimal,
     db: AsyncSession,
 ) -> PlaceLimitOrderResponse:
     """Handle BUY order logic."""
     order_cost = request.price * request.size
+    fill_now = request.price >= market_price
+    
+    # Filled orders pay the market price, open orders reserve the full limit cost
+    execution_cost = market_price * request.size if fill_now else order_cost
     
-    # Check sufficient funds
-    if account.balance < order_cost:
+    # Check sufficient funds and deduct from account balance in one atomic statement
+    result = await db.execute(
+        update(Account)
+        .where(
+            Account.account_id == request.account_id,
+            Account.balance >= order_cost,
+        )
+        .values(balance=Account.balance - execution_cost)
+        .returning(Account.balance)
+        .execution_options(synchronize_session=False)
+    )
+    if result.scalar_one_or_none() is None:
+        # No row updated - either the account doesn't exist or funds are short
+        available = await db.scalar(
+            select(Account.balance).where(Account.account_id == request.account_id)
+        )
+        if available is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Account with id '{request.account_id}' not found"
+            )
         raise HTTPException(
             status_code=400,
-            detail=f"Insufficient funds. Required: {order_cost}, Available: {account.balance}"
+            detail=f"Insufficient funds. Required: {order_cost}, Available: {available}"
         )
     
     # If limit price >= market price, fill immediately at market price
-    if request.price >= market_price:
-        execution_cost = market_price * request.size
-        
-        # Deduct from account balance
-        account.balance -= execution_cost
-        
-        # Update or create position (with lock to prevent concurrent modifications)
-        position = await _get_or_create_position(
-            db, request.account_id, request.token_id, lock=True
+    if fill_now:
+        # Create the position or add to it in a single atomic upsert
+        await db.execute(
+            pg_insert(Position)
+            .values(
+                account_id=request.account_id,
+                token_id=request.token_id,
+                shares=request.size,
+                total_cost=execution_cost,
+            )
+            .on_conflict_do_update(
+                index_elements=[Position.account_id, Position.token_id],
+                set_={
+                    "shares": Position.shares + request.size,
+                    "total_cost": Position.total_cost + execution_cost,
+                    "updated_at": func.now(),
+                },
+            )
         )
-        position.shares += request.size
-        position.total_cost += execution_cost
-        
-        # Create transaction record
-        transaction = Transaction(
-            account_id=request.account_id,
-            token_id=request.token_id,
-            execution_price=market_price,
-            side=OrderSide.BUY,
-            size=request.size,
+        
+        # Create transaction record, reading back its ID via RETURNING
+        result = await db.execute(
+            insert(Transaction)
+            .values(
+                account_id=request.account_id,
+                token_id=request.token_id,
+                execution_price=market_price,
+                side=OrderSide.BUY,
+                size=request.size,
+            )
+            .returning(Transaction.transaction_id)
         )
-        db.add(transaction)
+        transaction_id = result.scalar_one()
         
         await db.commit()
-        await db.refresh(transaction)
         
         return PlaceLimitOrderResponse(
-            transaction_id=transaction.transaction_id,
+            transaction_id=transaction_id,
             status="filled",
             message=f"Order filled immediately at market price {market_price}"
         )
     else:
-        # Reserve funds by deducting from account balance
-        account.balance -= order_cost
-        
-        # Create open order
-        order = Order(
-            account_id=request.account_id,
-            price=request.price,
-            size=request.size,
-            side=OrderSide.BUY,
-            token_id=request.token_id,
-            status=OrderStatus.OPEN,
+        # Funds were reserved by the balance update above
+        # Create open order with an ID generated here, so nothing needs to be read back
+        order_id = uuid7()
+        await db.execute(
+            insert(Order).values(
+                order_id=order_id,
+                account_id=request.account_id,
+                price=request.price,
+                size=request.size,
+                side=OrderSide.BUY,
+                token_id=request.token_id,
+                status=OrderStatus.OPEN,
+            )
         )
-        db.add(order)
         await db.commit()
-        await db.refresh(order)
         
         return PlaceLimitOrderResponse(
-            order_id=order.order_id,
+            order_id=order_id,
             status="open",
             message=f"Limit order created. {order_cost} reserved. Limit price {request.price} < market price {market_price}"
         )
@@ -217,113 +536,307 @@ async def _handle_buy_order(
 
 async def _handle_sell_order(
     request: PlaceLimitOrderRequest,
-    account: Account,
     market_price: Decimal,
     db: AsyncSession,
 ) -> PlaceLimitOrderResponse:
     """Handle SELL order logic."""
-    # Check position for sufficient shares (with lock to prevent concurrent modifications)
-    stmt = select(Position).where(
-        Position.account_id == request.account_id,
-        Position.token_id == request.token_id,
-    ).with_for_update()
-    result = await db.execute(stmt)
-    position = result.scalar_one_or_none()
+    fill_now = request.price <= market_price
     
-    if not position or position.shares < request.size:
-        available = position.shares if position else 0
+    # Check sufficient shares and deduct them in one atomic statement. A fill also
+    # removes the proportional cost basis - SET expressions all see the old row,
+    # and multiplying before dividing makes a full exit remove exactly total_cost
+    position_values = {"shares": Position.shares - request.size}
+    if fill_now:
+        position_values["total_cost"] = (
+            Position.total_cost - Position.total_cost * request.size / Position.shares
+        )
+    result = await db.execute(
+        update(Position)
+        .where(
+            Position.account_id == request.account_id,
+            Position.token_id == request.token_id,
+            Position.shares >= request.size,
+        )
+        .values(**position_values)
+        .returning(Position.shares)
+        .execution_options(synchronize_session=False)
+    )
+    if result.scalar_one_or_none() is None:
+        # No row updated - either there is no position or too few shares
+        available = await db.scalar(
+            select(Position.shares).where(
+                Position.account_id == request.account_id,
+                Position.token_id == request.token_id,
+            )
+        )
+        if available is None:
+            account_exists = await db.scalar(
+                select(Account.account_id).where(Account.account_id == request.account_id)
+            )
+            if account_exists is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Account with id '{request.account_id}' not found"
+                )
+            available = 0
         raise HTTPException(
             status_code=400,
             detail=f"Insufficient shares. Required: {request.size}, Available: {available}"
         )
     
     # If limit price <= market price, fill immediately at market price
-    if request.price <= market_price:
+    if fill_now:
         execution_proceeds = market_price * request.size
         
-        # Add to account balance
-        account.balance += execution_proceeds
-        
-        # Update position
-        # Calculate proportional cost basis to remove
-        cost_per_share = position.total_cost / position.shares if position.shares > 0 else Decimal("0")
-        cost_to_remove = cost_per_share * request.size
-        
-        position.shares -= request.size
-        position.total_cost -= cost_to_remove
+        # Add to account balance in a single atomic statement
+        await db.execute(
+            update(Account)
+            .where(Account.account_id == request.account_id)
+            .values(balance=Account.balance + execution_proceeds)
+            .execution_options(synchronize_session=False)
+        )
         
-        # Create transaction record
-        transaction = Transaction(
-            account_id=request.account_id,
-            token_id=request.token_id,
-            execution_price=market_price,
-            side=OrderSide.SELL,
-            size=request.size,
+        # Create transaction record, reading back its ID via RETURNING
+        result = await db.execute(
+            insert(Transaction)
+            .values(
+                account_id=request.account_id,
+                token_id=request.token_id,
+                execution_price=market_price,
+                side=OrderSide.SELL,
+                size=request.size,
+            )
+            .returning(Transaction.transaction_id)
         )
-        db.add(transaction)
+        transaction_id = result.scalar_one()
         
         await db.commit()
-        await db.refresh(transaction)
         
         return PlaceLimitOrderResponse(
-            transaction_id=transaction.transaction_id,
+            transaction_id=transaction_id,
             status="filled",
             message=f"Order filled immediately at market price {market_price}"
         )
     else:
-        # Reserve shares by deducting from position
-        position.shares -= request.size
-        
-        # Create open order
-        order = Order(
-            account_id=request.account_id,
-            price=request.price,
-            size=request.size,
-            side=OrderSide.SELL,
-            token_id=request.token_id,
-            status=OrderStatus.OPEN,
+        # Shares were reserved by the position update above
+        # Create open order with an ID generated here, so nothing needs to be read back
+        order_id = uuid7()
+        await db.execute(
+            insert(Order).values(
+                order_id=order_id,
+                account_id=request.account_id,
+                price=request.price,
+                size=request.size,
+                side=OrderSide.SELL,
+                token_id=request.token_id,
+                status=OrderStatus.OPEN,
+            )
         )
-        db.add(order)
         await db.commit()
-        await db.refresh(order)
         
         return PlaceLimitOrderResponse(
-            order_id=order.order_id,
+            order_id=order_id,
             status="open",
             message=f"Limit order created. {request.size} shares reserved. Limit price {request.price} > market price {market_price}"
         )
 
 
-async def _get_or_create_position(
-    db: AsyncSession, account_id: uuid.UUID, token_id: str, lock: bool = False
-) -> Position:
-    """Get existing position or create a new one.
+async def place_limit_orders_batch_handler(
+    request: PlaceLimitOrdersBatchRequest, db: AsyncSession
+) -> PlaceLimitOrdersBatchResponse:
+    """
+    Place many limit orders in a single transaction.
+    
+    Each order follows the same fill/open rules as place_limit_order_handler and
+    orders are applied in the given sequence, so later orders see the balance and
+    positions left by earlier ones. If any order is rejected the whole batch is
+    rolled back.
     
-    Args:
-        db: Database session
-        account_id: Account UUID
-        token_id: Token ID
-        lock: If True, use SELECT ... FOR UPDATE to lock the row
+    Note: All affected accounts and positions are locked up front with two
+    SELECT ... FOR UPDATE queries, and transactions and open orders are written
+    with one multi-row INSERT each before a single commit.
     """
-    stmt = select(Position).where(
-        Position.account_id == account_id,
-        Position.token_id == token_id,
-    )
-    if lock:
-        stmt = stmt.with_for_update()
-    result = await db.execute(stmt)
-    position = result.scalar_one_or_none()
-    
-    if not position:
-        position = Position(
-            account_id=account_id,
-            token_id=token_id,
-            shares=0,
-            total_cost=Decimal("0.00"),
-        )
-        db.add(position)
+    orders = request.orders
+    if not orders:
+        return PlaceLimitOrdersBatchResponse(results=[])
     
-    return position
+    try:
+        # Fetch every distinct market price concurrently BEFORE acquiring any locks
+        price_keys = list(dict.fromkeys((o.token_id, o.side) for o in orders))
+        prices = await asyncio.gather(
+            *(get_market_price(token_id, side) for token_id, side in price_keys)
+        )
+        market_prices = dict(zip(price_keys, prices))
+        
+        # Lock all affected accounts, in a stable order to avoid deadlocks
+        account_ids = sorted({o.account_id for o in orders})
+        stmt = (
+            select(Account)
+            .where(Account.account_id.in_(account_ids))
+            .order_by(Account.account_id)
+            .with_for_update()
+        )
+        result = await db.execute(stmt)
+        accounts = {account.account_id: account for account in result.scalars()}
+        
+        # Lock all affected positions
+        position_keys = sorted({(o.account_id, o.token_id) for o in orders})
+        stmt = (
+            select(Position)
+            .where(tuple_(Position.account_id, Position.token_id).in_(position_keys))
+            .order_by(Position.account_id, Position.token_id)
+            .with_for_update()
+        )
+        result = await db.execute(stmt)
+        positions = {
+            (position.account_id, position.token_id): position
+            for position in result.scalars()
+        }
+        
+        transaction_rows: list[dict] = []
+        order_rows: list[dict] = []
+        # Per order: ("filled" | "open", index into the matching row list, message)
+        placed: list[tuple[str, int, str]] = []
+        
+        for i, o in enumerate(orders):
+            account = accounts.get(o.account_id)
+            if not account:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Order {i}: Account with id '{o.account_id}' not found"
+                )
+            
+            market_price = market_prices[(o.token_id, o.side)]
+            position = positions.get((o.account_id, o.token_id))
+            
+            if o.side == OrderSide.BUY:
+                order_cost = o.price * o.size
+                if account.balance < order_cost:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Order {i}: Insufficient funds. Required: {order_cost}, Available: {account.balance}"
+                    )
+                
+                if o.price >= market_price:
+                    execution_cost = market_price * o.size
+                    account.balance -= execution_cost
+                    
+                    if not position:
+                        position = Position(
+                            account_id=o.account_id,
+                            token_id=o.token_id,
+                            shares=0,
+                            total_cost=_ZERO,
+                        )
+                        db.add(position)
+                        positions[(o.account_id, o.token_id)] = position
+                    position.shares += o.size
+                    position.total_cost += execution_cost
+                    
+                    placed.append((
+                        "filled",
+                        len(transaction_rows),
+                        f"Order filled immediately at market price {market_price}",
+                    ))
+                else:
+                    account.balance -= order_cost
+                    placed.append((
+                        "open",
+                        len(order_rows),
+                        f"Limit order created. {order_cost} reserved. Limit price {o.price} < market price {market_price}",
+                    ))
+            else:
+                if not position or position.shares < o.size:
+                    available = position.shares if position else 0
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Order {i}: Insufficient shares. Required: {o.size}, Available: {available}"
+                    )
+                
+                if o.price <= market_price:
+                    account.balance += market_price * o.size
+                    
+                    # Remove proportional cost basis
+                    position.total_cost -= position.total_cost * o.size / position.shares
+                    position.shares -= o.size
+                    
+                    placed.append((
+                        "filled",
+                        len(transaction_rows),
+                        f"Order filled immediately at market price {market_price}",
+                    ))
+                else:
+                    position.shares -= o.size
+                    placed.append((
+                        "open",
+                        len(order_rows),
+                        f"Limit order created. {o.size} shares reserved. Limit price {o.price} > market price {market_price}",
+                    ))
+            
+            if placed[-1][0] == "filled":
+                transaction_rows.append({
+                    "account_id": o.account_id,
+                    "token_id": o.token_id,
+                    "execution_price": market_price,
+                    "side": o.side,
+                    "size": o.size,
+                })
+            else:
+                order_rows.append({
+                    "account_id": o.account_id,
+                    "price": o.price,
+                    "size": o.size,
+                    "side": o.side,
+                    "token_id": o.token_id,
+                    "status": OrderStatus.OPEN,
+                })
+        
+        # Write all transactions and open orders with one multi-row INSERT each
+        transaction_ids: list[uuid.UUID] = []
+        if transaction_rows:
+            result = await db.execute(
+                insert(Transaction).returning(
+                    Transaction.transaction_id, sort_by_parameter_order=True
+                ),
+                transaction_rows,
+            )
+            transaction_ids = list(result.scalars())
+        
+        order_ids: list[uuid.UUID] = []
+        if order_rows:
+            result = await db.execute(
+                insert(Order).returning(Order.order_id, sort_by_parameter_order=True),
+                order_rows,
+            )
+            order_ids = list(result.scalars())
+        
+        await db.commit()
+        
+        results = []
+        for status, row_index, message in placed:
+            if status == "filled":
+                results.append(PlaceLimitOrderResponse(
+                    transaction_id=transaction_ids[row_index],
+                    status=status,
+                    message=message,
+                ))
+            else:
+                results.append(PlaceLimitOrderResponse(
+                    order_id=order_ids[row_index],
+                    status=status,
+                    message=message,
+                ))
+        
+        return PlaceLimitOrdersBatchResponse(results=results)
+        
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500, detail=f"Failed to place limit orders: {str(e)}"
+        )
 
 
 async def cancel_order_handler(
@@ -334,51 +847,55 @@ async def cancel_order_handler(
     
     Only orders with status OPEN can be cancelled.
     
-    Note: Uses SELECT ... FOR UPDATE to lock rows and prevent race conditions.
+    Note: The status check and the status change happen in one atomic UPDATE,
+    so two concurrent cancels can't both refund the same order.
     """
     try:
-        # Get the order with lock
-        stmt = select(Order).where(Order.order_id == order_id).with_for_update()
+        # Cancel the order only if it is still open, reading back what to refund
+        stmt = (
+            update(Order)
+            .where(Order.order_id == order_id, Order.status == OrderStatus.OPEN)
+            .values(status=OrderStatus.CANCELLED)
+            .returning(Order.account_id, Order.token_id, Order.side, Order.price, Order.size)
+            .execution_options(synchronize_session=False)
+        )
         result = await db.execute(stmt)
-        order = result.scalar_one_or_none()
+        order = result.one_or_none()
         
         if not order:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Order with id '{order_id}' not found"
-            )
-        
-        # Check if order can be cancelled
-        if order.status != OrderStatus.OPEN:
+            # Nothing updated - either the order doesn't exist or it isn't open
+            status = await db.scalar(select(Order.status).where(Order.order_id == order_id))
+            if status is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Order with id '{order_id}' not found"
+                )
             raise HTTPException(
                 status_code=400,
-                detail=f"Cannot cancel order. Current status is '{order.status.value}', only OPEN orders can be cancelled"
+                detail=f"Cannot cancel order. Current status is '{status.value}', only OPEN orders can be cancelled"
             )
         
         # If BUY order, refund reserved funds
         if order.side == OrderSide.BUY:
-            stmt = select(Account).where(Account.account_id == order.account_id).with_for_update()
-            result = await db.execute(stmt)
-            account = result.scalar_one_or_none()
-            
-            if account:
-                reserved_amount = order.price * order.size
-                account.balance += reserved_amount
+            await db.execute(
+                update(Account)
+                .where(Account.account_id == order.account_id)
+                .values(balance=Account.balance + order.price * order.size)
+                .execution_options(synchronize_session=False)
+            )
         
         # If SELL order, refund reserved shares
         elif order.side == OrderSide.SELL:
-            stmt = select(Position).where(
-                Position.account_id == order.account_id,
-                Position.token_id == order.token_id,
-            ).with_for_update()
-            result = await db.execute(stmt)
-            position = result.scalar_one_or_none()
-            
-            if position:
-                position.shares += order.size
+            await db.execute(
+                update(Position)
+                .where(
+                    Position.account_id == order.account_id,
+                    Position.token_id == order.token_id,
+                )
+                .values(shares=Position.shares + order.size)
+                .execution_options(synchronize_session=False)
+            )
         
-        # Update order status to CANCELLED
-        order.status = OrderStatus.CANCELLED
         await db.commit()
         
         return CancelOrderResponse(
@@ -403,12 +920,10 @@ async def get_open_orders_handler(
     """
     Get all open orders for an account.
     """
-    # Get the account by name
-    stmt = select(Account).where(Account.account_name == account_name)
-    result = await db.execute(stmt)
-    account = result.scalar_one_or_none()
+    # Resolve the account by name
+    account_id = await resolve_account_id(account_name, db)
 
-    if not account:
+    if account_id is None:
         raise HTTPException(
             status_code=404,
             detail=f"Account with name '{account_name}' not found"
@@ -416,8 +931,8 @@ async def get_open_orders_handler(
 
     # Get all open orders for this account
     stmt = select(Order).where(
-        Order.account_id == account.account_id,
-        Order.status == OrderStatus.OPEN,
+        Order.account_id == account_id,
+        _ORDER_IS_OPEN,
     )
     result = await db.execute(stmt)
     orders = result.scalars().all()
@@ -448,47 +963,69 @@ async def get_batch_market_prices(token_ids: list[str]) -> dict[str, dict[str, D
     Returns a dict mapping token_id to {"BUY": price, "SELL": price}
     where BUY is the bid price and SELL is the ask price.
     
+    Tokens with a recent two-sided book on the live price stream are answered
+    from memory. The rest are cached for BATCH_PRICE_CACHE_TTL_SECONDS; only
+    tokens without a fresh cached price are requested.
+    
     Reference: https://docs.polymarket.com/api-reference/pricing/get-multiple-market-prices-by-request
     """
     if not token_ids:
         return {}
     
-    # Build request payload - request both BUY and SELL for each token
-    payload = []
+    subscribe_prices(token_ids)
+    
+    now = time.monotonic()
+    result: dict[str, dict[str, Decimal]] = {}
+    missing: list[str] = []
     for token_id in token_ids:
-        payload.append({"token_id": token_id, "side": "BUY"})
-        payload.append({"token_id": token_id, "side": "SELL"})
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{POLYMARKET_CLOB_URL}/prices",
-            json=payload,
-            timeout=10.0,
-        )
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=502,
-                detail=f"Failed to get market prices from Polymarket: {response.text}"
-            )
-        
-        data = response.json()
-        # Convert string prices to Decimal
-        result: dict[str, dict[str, Decimal]] = {}
-        for token_id, prices in data.items():
-            result[token_id] = {
-                side: Decimal(price) for side, price in prices.items()
-            }
+        streamed = get_streamed_prices(token_id)
+        # A book with an emptied side isn't a full answer; fetch it like a miss,
+        # as get_market_price does per side
+        if streamed is not None and "BUY" in streamed and "SELL" in streamed:
+            result[token_id] = streamed
+            continue
+        cached = _batch_price_cache.get(token_id)
+        if cached and cached[0] > now:
+            result[token_id] = cached[1]
+        else:
+            missing.append(token_id)
+    
+    if not missing:
         return result
+    
+    # Build request payload - request both BUY and SELL for each token
+    payload = [
+        {"token_id": token_id, "side": side}
+        for token_id in missing
+        for side in ("BUY", "SELL")
+    ]
+    
+    data = await _post_prices(payload)
+    
+    if len(_batch_price_cache) >= BATCH_PRICE_CACHE_MAX_SIZE:
+        for expired_key in [k for k, (expires_at, _) in _batch_price_cache.items() if expires_at <= now]:
+            del _batch_price_cache[expired_key]
+    
+    # Convert string prices to Decimal
+    expires_at = time.monotonic() + BATCH_PRICE_CACHE_TTL_SECONDS
+    for token_id, prices in data.items():
+        result[token_id] = {
+            side: Decimal(price) for side, price in prices.items()
+        }
+        _batch_price_cache[token_id] = (expires_at, result[token_id])
+    return result
 
 
 async def process_open_orders_handler(
     db: AsyncSession,
+    include_messages: bool = False,
 ) -> ProcessOpenOrdersResponse:
     """
     Process all open orders and fill those that can be executed.
     
-    Uses batch API to fetch all market prices in a single request.
+    Streams open orders from the database and fetches market prices through
+    the batch API as each batch arrives, then fills all crossing orders
+    together with a few set-based statements.
     
     For BUY orders:
     - Check the ask price (SELL side in API response)
@@ -497,93 +1034,102 @@ async def process_open_orders_handler(
     For SELL orders:
     - Check the bid price (BUY side in API response)
     - If bid price >= limit price, fill at limit price
-    """
-    results: list[ProcessedOrderResult] = []
-    orders_filled = 0
-    orders_skipped = 0
     
+    Per-order messages are only formatted when include_messages is set;
+    otherwise each result carries an empty message.
+    """
     try:
-        # Get all OPEN orders
-        stmt = select(Order).where(Order.status == OrderStatus.OPEN)
-        result = await db.execute(stmt)
-        open_orders = result.scalars().all()
-        
-        if not open_orders:
-            return ProcessOpenOrdersResponse(
-                total_orders_checked=0,
-                orders_filled=0,
-                orders_skipped=0,
-                results=[],
-            )
+        # Stream OPEN orders in batches, fetching prices for each batch's new
+        # tokens while the following batches are still being read
+        stmt = select(Order).where(_ORDER_IS_OPEN).execution_options(yield_per=OPEN_ORDERS_YIELD_PER)
+        open_orders: list[Order] = []
+        seen_token_ids: set[str] = set()
+        price_tasks: list[asyncio.Task] = []
+        try:
+            result = await db.stream_scalars(stmt)
+            async for batch in result.partitions():
+                new_token_ids = {order.token_id for order in batch} - seen_token_ids
+                if new_token_ids:
+                    seen_token_ids |= new_token_ids
+                    price_tasks.append(asyncio.create_task(get_batch_market_prices(list(new_token_ids))))
+                open_orders.extend(batch)
+            
+            if not open_orders:
+                return ProcessOpenOrdersResponse(
+                    total_orders_checked=0,
+                    orders_filled=0,
+                    orders_skipped=0,
+                    results=[],
+                )
+            
+            market_prices: dict[str, dict[str, Decimal]] = {}
+            for prices in await asyncio.gather(*price_tasks):
+                market_prices.update(prices)
+        except BaseException:
+            for task in price_tasks:
+                task.cancel()
+            raise
         
-        # Collect unique token_ids and fetch all prices in one batch call
-        unique_token_ids = list({order.token_id for order in open_orders})
-        market_prices = await get_batch_market_prices(unique_token_ids)
+        # Flatten to (token_id, api_side) -> price so each order needs one lookup
+        flat_prices = {
+            (token_id, api_side): price
+            for token_id, sides in market_prices.items()
+            for api_side, price in sides.items()
+        }
         
+        # Decide which orders cross the market; everything else is skipped
+        fillable: dict[uuid.UUID, Decimal] = {}  # order_id -> market price
+        skip_messages: dict[uuid.UUID, str] = {}
         for order in open_orders:
-            try:
-                token_prices = market_prices.get(order.token_id)
-                
-                if not token_prices:
-                    results.append(ProcessedOrderResult(
-                        order_id=order.order_id,
-                        status="skipped",
-                        message=f"No market price available for token {order.token_id}"
-                    ))
-                    orders_skipped += 1
-                    continue
-                
-                # For BUY orders, check ASK price (SELL side in API)
-                # For SELL orders, check BID price (BUY side in API)
-                if order.side == OrderSide.BUY:
-                    market_price = token_prices.get("SELL")  # Ask price
-                    should_fill = market_price is not None and market_price <= order.price
-                else:
-                    market_price = token_prices.get("BUY")  # Bid price
-                    should_fill = market_price is not None and market_price >= order.price
-                
-                if market_price is None:
-                    results.append(ProcessedOrderResult(
-                        order_id=order.order_id,
-                        status="skipped",
-                        message=f"No {'ask' if order.side == OrderSide.BUY else 'bid'} price available"
-                    ))
-                    orders_skipped += 1
-                    continue
-                
-                if should_fill:
-                    # Fill the order at limit price
-                    transaction_id = await _fill_order_at_limit_price(order, db)
-                    
-                    results.append(ProcessedOrderResult(
-                        order_id=order.order_id,
-                        transaction_id=transaction_id,
-                        status="filled",
-                        message=f"Order filled at limit price {order.price}. Market price was {market_price}."
-                    ))
-                    orders_filled += 1
-                else:
-                    results.append(ProcessedOrderResult(
-                        order_id=order.order_id,
-                        status="skipped",
-                        message=f"Order not filled. Limit price {order.price}, market price {market_price}."
-                    ))
-                    orders_skipped += 1
-                    
-            except Exception as e:
+            # BUY orders check the ask (SELL side in API), SELL orders the bid
+            market_price = flat_prices.get((order.token_id, _API_SIDE[order.side]))
+            
+            if market_price is not None and _CROSSES_LIMIT[order.side](market_price, order.price):
+                fillable[order.order_id] = market_price
+            elif not include_messages:
+                continue
+            elif market_price is not None:
+                skip_messages[order.order_id] = f"Order not filled. Limit price {order.price}, market price {market_price}."
+            elif not market_prices.get(order.token_id):
+                skip_messages[order.order_id] = f"No market price available for token {order.token_id}"
+            else:
+                skip_messages[order.order_id] = f"No {'ask' if order.side == OrderSide.BUY else 'bid'} price available"
+        
+        # Fill all crossing orders at their limit prices with set-based statements
+        transaction_ids = await _fill_orders_at_limit_price(list(fillable), db)
+        
+        await db.commit()
+        
+        results: list[ProcessedOrderResult] = []
+        for order in open_orders:
+            transaction_id = transaction_ids.get(order.order_id)
+            if transaction_id:
+                results.append(ProcessedOrderResult(
+                    order_id=order.order_id,
+                    transaction_id=transaction_id,
+                    status="filled",
+                    message=(
+                        f"Order filled at limit price {order.price}. Market price was {fillable[order.order_id]}."
+                        if include_messages else ""
+                    ),
+                ))
+            else:
                 results.append(ProcessedOrderResult(
                     order_id=order.order_id,
                     status="skipped",
-                    message=f"Error processing order: {str(e)}"
+                    # Crossing orders only miss a fill if they were cancelled or
+                    # picked up by another run meanwhile
+                    message=(
+                        skip_messages.get(order.order_id, "Order is no longer open or is being processed elsewhere")
+                        if include_messages else ""
+                    ),
                 ))
-                orders_skipped += 1
-        
-        await db.commit()
         
+        orders_filled = len(transaction_ids)
         return ProcessOpenOrdersResponse(
             total_orders_checked=len(open_orders),
             orders_filled=orders_filled,
-            orders_skipped=orders_skipped,
+            orders_skipped=len(open_orders) - orders_filled,
             results=results,
         )
         
@@ -595,76 +1141,105 @@ async def process_open_orders_handler(
         )
 
 
-async def _fill_order_at_limit_price(
-    order: Order, db: AsyncSession
-) -> uuid.UUID:
+async def _fill_orders_at_limit_price(
+    order_ids: list[uuid.UUID], db: AsyncSession
+) -> dict[uuid.UUID, uuid.UUID]:
     """
-    Fill an order at its limit price.
+    Fill orders at their limit prices with one statement per table.
     
     For BUY orders:
     - The funds were already reserved when the order was placed
-    - We need to refund the difference if limit price > execution price (but we fill at limit)
-    - Update position
+    - Add the shares and their cost to the position
     
     For SELL orders:
     - The shares were already reserved when the order was placed
     - Add proceeds to account balance
-    - Update position cost basis
     
-    Note: Uses SELECT ... FOR UPDATE to lock rows and prevent race conditions.
+    Returns a dict mapping each filled order_id to its transaction_id. Orders
+    that are no longer OPEN, or are locked by a concurrent cancel or fill, are
+    left out.
     """
-    # Get the account with lock to prevent concurrent modifications
-    stmt = select(Account).where(Account.account_id == order.account_id).with_for_update()
-    result = await db.execute(stmt)
-    account = result.scalar_one_or_none()
-    
-    if not account:
-        raise Exception(f"Account {order.account_id} not found")
+    if not order_ids:
+        return {}
     
-    execution_price = order.price  # Fill at limit price
+    # Lock the orders that are still open, skipping rows another runner or a
+    # cancel already holds so concurrent runners fill disjoint sets of orders
+    # without waiting on each other
+    lockable_orders = (
+        select(Order.order_id)
+        .where(Order.order_id.in_(order_ids), Order.status == OrderStatus.OPEN)
+        .with_for_update(skip_locked=True)
+    )
     
-    if order.side == OrderSide.BUY:
-        # Funds were already deducted when order was placed (price * size)
-        # Since we fill at limit price, no refund needed
-        
-        # Update or create position (with lock)
-        position = await _get_or_create_position(db, order.account_id, order.token_id, lock=True)
-        position.shares += order.size
-        position.total_cost += execution_price * order.size
-        
-    else:  # SELL
-        # Shares were already deducted when order was placed
-        # Add proceeds to account balance
-        proceeds = execution_price * order.size
-        account.balance += proceeds
-        
-        # Get position to update cost basis (with lock)
-        stmt = select(Position).where(
-            Position.account_id == order.account_id,
-            Position.token_id == order.token_id,
-        ).with_for_update()
-        result = await db.execute(stmt)
-        position = result.scalar_one_or_none()
-        
-        if position and position.total_cost > 0:
-            # The shares were already removed, so we need to calculate cost basis
-            # based on what was removed when order was placed
-            # Since shares were already deducted, we need to track cost basis separately
-            # For simplicity, we'll just adjust total_cost proportionally if there are remaining shares
-            pass  # Cost basis was already handled when shares were reserved
-    
-    # Create transaction record
-    transaction = Transaction(
-        account_id=order.account_id,
-        token_id=order.token_id,
-        execution_price=execution_price,
-        side=order.side,
-        size=order.size,
+    # Mark them filled and read back their terms
+    result = await db.execute(
+        update(Order)
+        .where(Order.order_id.in_(lockable_orders))
+        .values(status=OrderStatus.FILLED)
+        .returning(Order.order_id, Order.account_id, Order.token_id, Order.side, Order.price, Order.size)
+        .execution_options(synchronize_session=False)
     )
-    db.add(transaction)
+    filled = result.all()
     
-    # Update order status to FILLED
-    order.status = OrderStatus.FILLED
+    if not filled:
+        return {}
     
-    return transaction.transaction_id
-
+    # Aggregate per position and per account, since one statement can't
+    # update the same row twice
+    bought: dict[tuple[uuid.UUID, str], tuple[int, Decimal]] = {}
+    proceeds: dict[uuid.UUID, Decimal] = {}
+    for order in filled:
+        execution_cost = order.price * order.size  # Fill at limit price
+        if order.side == OrderSide.BUY:
+            key = (order.account_id, order.token_id)
+            shares, total_cost = bought.get(key, (0, _ZERO))
+            bought[key] = (shares + order.size, total_cost + execution_cost)
+        else:
+            proceeds[order.account_id] = proceeds.get(order.account_id, _ZERO) + execution_cost
+    
+    # Add bought shares to positions, creating any that don't exist yet.
+    # Rows are sorted so concurrent fills lock them in the same order.
+    if bought:
+        stmt = pg_insert(Position).values([
+            {"account_id": account_id, "token_id": token_id, "shares": shares, "total_cost": total_cost}
+            for (account_id, token_id), (shares, total_cost) in sorted(bought.items())
+        ])
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Position.account_id, Position.token_id],
+                set_={
+                    "shares": Position.shares + stmt.excluded.shares,
+                    "total_cost": Position.total_cost + stmt.excluded.total_cost,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+    
+    # Credit sale proceeds with one executemany UPDATE
+    if proceeds:
+        await db.execute(
+            update(Account.__table__)
+            .where(Account.account_id == bindparam("credit_account_id"))
+            .values(balance=Account.balance + bindparam("amount")),
+            [
+                {"credit_account_id": account_id, "amount": amount}
+                for account_id, amount in sorted(proceeds.items())
+            ],
+        )
+    
+    # Create all transaction records with one multi-row INSERT
+    result = await db.execute(
+        insert(Transaction).returning(Transaction.transaction_id, sort_by_parameter_order=True),
+        [
+            {
+                "account_id": order.account_id,
+                "token_id": order.token_id,
+                "execution_price": order.price,
+                "side": order.side,
+                "size": order.size,
+            }
+            for order in filled
+        ],
+    )
+    
+    return dict(zip((order.order_id for order in filled), result.scalars()))
@@ -0,0 +1,262 @@
+"""
+Live Polymarket best bid/ask prices from the CLOB market WebSocket channel.
+
+Price lookups subscribe their tokens here and read prices from memory while the
+stream has a recent book for them, falling back to the HTTP /prices API otherwise.
+"""
+
+import asyncio
+import logging
+import time
+from decimal import Decimal
+
+import orjson
+from websockets.asyncio.client import ClientConnection, connect
+
+logger = logging.getLogger(__name__)
+
+POLYMARKET_WS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+# Upper bound on tokens kept subscribed; lookups for tokens beyond it use HTTP
+PRICE_STREAM_MAX_TOKENS = 2000
+
+# Subscribed tokens not looked up for this long may be unsubscribed to make room
+PRICE_STREAM_IDLE_TOKEN_SECONDS = 300.0
+
+# Streamed prices not updated for this long are ignored in favour of HTTP
+PRICE_STREAM_MAX_PRICE_AGE_SECONDS = 5.0
+
+# Polymarket drops market channel connections that don't send a PING this often
+PRICE_STREAM_PING_INTERVAL_SECONDS = 10.0
+
+# Every PING is answered with a PONG, so a connection silent for this long is dead
+PRICE_STREAM_RECEIVE_TIMEOUT_SECONDS = 25.0
+
+# Reconnect backoff after the connection fails or drops
+PRICE_STREAM_RECONNECT_MIN_SECONDS = 0.5
+PRICE_STREAM_RECONNECT_MAX_SECONDS = 30.0
+
+
+class MarketPriceStream:
+    """
+    Keeps best bid/ask prices for subscribed tokens from the market channel.
+
+    Prices are stored as token_id -> {"BUY": bid, "SELL": ask}, the same shape
+    the /prices API returns. A token only has prices once a book snapshot for
+    it has arrived; later price_change events keep them current. Prices are
+    cleared whenever the connection drops or stops answering PINGs, and prices
+    not updated within max_price_age are not served.
+
+    When the subscription is full, tokens that have not been looked up for
+    PRICE_STREAM_IDLE_TOKEN_SECONDS are unsubscribed, least recently used first.
+    """
+
+    def __init__(
+        self,
+        url: str = POLYMARKET_WS_MARKET_URL,
+        max_tokens: int = PRICE_STREAM_MAX_TOKENS,
+        max_price_age: float = PRICE_STREAM_MAX_PRICE_AGE_SECONDS,
+    ):
+        self._url = url
+        self._max_tokens = max_tokens
+        self._max_price_age = max_price_age
+        # token_id -> last lookup time, least recently used first
+        self._token_ids: dict[str, float] = {}
+        self._prices: dict[str, dict[str, Decimal]] = {}
+        self._updated_at: dict[str, float] = {}
+        # (operation, token_ids) changes to send on the live connection
+        self._subscription_changes: asyncio.Queue[tuple[str, list[str]]] = asyncio.Queue()
+        self._has_tokens = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background connection task. Must be called from within an async context."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background connection task and forget all prices."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._clear_prices()
+
+    def get(self, token_id: str) -> dict[str, Decimal] | None:
+        """Return the streamed {side: price} for a token, or None if not available or stale."""
+        now = time.monotonic()
+        self._touch(token_id, now)
+        prices = self._prices.get(token_id)
+        if prices is None or now - self._updated_at[token_id] > self._max_price_age:
+            return None
+        return prices
+
+    def subscribe(self, token_ids: list[str] | tuple[str, ...]) -> None:
+        """Start streaming prices for any of the given tokens not yet subscribed."""
+        if self._task is None:
+            return
+        now = time.monotonic()
+        new_token_ids = []
+        for token_id in dict.fromkeys(token_ids):
+            if token_id in self._token_ids:
+                self._touch(token_id, now)
+            else:
+                new_token_ids.append(token_id)
+        self._evict_idle(len(new_token_ids), now)
+        new_token_ids = new_token_ids[: self._max_tokens - len(self._token_ids)]
+        if not new_token_ids:
+            return
+        for token_id in new_token_ids:
+            self._token_ids[token_id] = now
+        self._subscription_changes.put_nowait(("subscribe", new_token_ids))
+        self._has_tokens.set()
+
+    def _touch(self, token_id: str, now: float) -> None:
+        # Move a subscribed token to the most recently used end
+        if self._token_ids.pop(token_id, None) is not None:
+            self._token_ids[token_id] = now
+
+    def _evict_idle(self, wanted: int, now: float) -> None:
+        # Unsubscribe idle tokens, oldest first, until `wanted` new ones fit
+        evicted = []
+        for token_id, last_used in self._token_ids.items():
+            if len(self._token_ids) - len(evicted) + wanted <= self._max_tokens:
+                break
+            if now - last_used < PRICE_STREAM_IDLE_TOKEN_SECONDS:
+                break
+            evicted.append(token_id)
+        if not evicted:
+            return
+        for token_id in evicted:
+            del self._token_ids[token_id]
+            self._prices.pop(token_id, None)
+            self._updated_at.pop(token_id, None)
+        self._subscription_changes.put_nowait(("unsubscribe", evicted))
+
+    def _clear_prices(self) -> None:
+        self._prices.clear()
+        self._updated_at.clear()
+
+    async def _run(self) -> None:
+        delay = PRICE_STREAM_RECONNECT_MIN_SECONDS
+        while True:
+            await self._has_tokens.wait()
+            try:
+                async with connect(self._url) as ws:
+                    delay = PRICE_STREAM_RECONNECT_MIN_SECONDS
+                    await self._serve(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Polymarket price stream disconnected: {e!r}")
+            finally:
+                self._clear_prices()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PRICE_STREAM_RECONNECT_MAX_SECONDS)
+
+    async def _serve(self, ws: ClientConnection) -> None:
+        # The initial subscription covers every current token, so drop queued changes
+        while not self._subscription_changes.empty():
+            self._subscription_changes.get_nowait()
+        await ws.send(orjson.dumps({"assets_ids": sorted(self._token_ids), "type": "market"}).decode())
+
+        tasks = [
+            asyncio.create_task(self._read(ws)),
+            asyncio.create_task(self._ping(ws)),
+            asyncio.create_task(self._send_subscriptions(ws)),
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            task.result()
+
+    async def _ping(self, ws: ClientConnection) -> None:
+        while True:
+            await asyncio.sleep(PRICE_STREAM_PING_INTERVAL_SECONDS)
+            await ws.send("PING")
+
+    async def _send_subscriptions(self, ws: ClientConnection) -> None:
+        while True:
+            operation, token_ids = await self._subscription_changes.get()
+            await ws.send(orjson.dumps({"assets_ids": token_ids, "operation": operation}).decode())
+
+    async def _read(self, ws: ClientConnection) -> None:
+        while True:
+            # A half-open connection never raises on its own, so bound every receive
+            async with asyncio.timeout(PRICE_STREAM_RECEIVE_TIMEOUT_SECONDS):
+                message = await ws.recv()
+            if message == "PONG":
+                continue
+            data = orjson.loads(message)
+            # Subscriptions start with a list of book snapshots
+            for event in data if isinstance(data, list) else (data,):
+                event_type = event.get("event_type")
+                if event_type == "book":
+                    self._apply_book(event)
+                elif event_type == "price_change":
+                    self._apply_price_changes(event)
+
+    def _apply_book(self, event: dict) -> None:
+        asset_id = event["asset_id"]
+        # Late snapshots for unsubscribed tokens would otherwise linger
+        if asset_id not in self._token_ids:
+            return
+        prices: dict[str, Decimal] = {}
+        bids = event.get("bids") or []
+        asks = event.get("asks") or []
+        if bids:
+            prices["BUY"] = max(Decimal(level["price"]) for level in bids)
+        if asks:
+            prices["SELL"] = min(Decimal(level["price"]) for level in asks)
+        self._prices[asset_id] = prices
+        self._updated_at[asset_id] = time.monotonic()
+
+    def _apply_price_changes(self, event: dict) -> None:
+        now = time.monotonic()
+        for change in event.get("price_changes") or []:
+            # Changes only refine a known book; tokens without one wait for it
+            asset_id = change.get("asset_id")
+            prices = self._prices.get(asset_id)
+            if prices is None:
+                continue
+            self._updated_at[asset_id] = now
+            for api_side, field in (("BUY", "best_bid"), ("SELL", "best_ask")):
+                best = change.get(field)
+                if not best:
+                    continue
+                price = Decimal(best)
+                # An emptied side is reported as a zero bid or a one ask
+                if price == (0 if api_side == "BUY" else 1):
+                    prices.pop(api_side, None)
+                else:
+                    prices[api_side] = price
+
+
+_price_stream = MarketPriceStream()
+
+
+async def init_price_stream() -> None:
+    """Start the shared Polymarket price stream. Must be called from within an async context."""
+    _price_stream.start()
+
+
+async def close_price_stream() -> None:
+    """Stop the shared Polymarket price stream."""
+    await _price_stream.stop()
+
+
+def get_streamed_prices(token_id: str) -> dict[str, Decimal] | None:
+    """Return the streamed {"BUY": bid, "SELL": ask} prices for a token, if recent."""
+    return _price_stream.get(token_id)
+
+
+def subscribe_prices(token_ids: list[str] | tuple[str, ...]) -> None:
+    """Start streaming prices for the given tokens. A no-op until the stream is started."""
+    _price_stream.subscribe(token_ids)
@@ -1,32 +1,138 @@
 import asyncio
 import math
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal
 from typing import Optional
 
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import or_, select
+from sqlalchemy import and_, bindparam, cast, func, insert, lambda_stmt, literal_column, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import database
-from kalshi_utils import create_kalshi_order, fetch_market_data_for_tickers
+from kalshi_utils import create_kalshi_order, fetch_cached_market_data_for_tickers, fetch_market_data_for_tickers
 from models.account import Account
-from models.order import KalshiOrder, KalshiOrderStatus, KalshiOrderAction, KalshiOrderSide
+from models.order import KalshiOrder, KalshiOrderAction, KalshiOrderSide
 from models.position import KalshiPosition
 from models.strategy import Strategy, StrategySide
 
-
-def _convert_market_data_to_decimals(raw_market_data: dict) -> dict:
+# Cap on strategies processed at once, each holding its own pooled DB connection,
+# so a large account can't drain the pool for every other request
+STRATEGY_PROCESSING_CONCURRENCY = 10
+
+# Active strategies are streamed in batches of this size so market data for
+# early batches is fetched while later ones are still being read
+ACTIVE_STRATEGIES_YIELD_PER = 100
+
+# Quantum for rounding a price in cents to whole cents
+_WHOLE_CENTS = Decimal("1")
+
+# Kalshi order side placed for each strategy side
+_ORDER_SIDE = {StrategySide.YES: KalshiOrderSide.YES, StrategySide.NO: KalshiOrderSide.NO}
+
+# Account name -> tickers of its active strategies on the last lookup, used to
+# start fetching market data before the strategies themselves have been read
+ACTIVE_STRATEGY_TICKERS_CACHE_MAX_SIZE = 1024
+_active_strategy_tickers: dict[str, frozenset[str]] = {}
+
+# Lookups run on every strategy request, built once as lambda statements so
+# SQLAlchemy caches them by code location instead of rebuilding each call
+_ACCOUNT_BY_NAME = lambda_stmt(
+    lambda: select(Account).where(Account.account_name == bindparam("account_name"))
+)
+_STRATEGY_BY_ID = lambda_stmt(
+    lambda: select(Strategy).where(Strategy.strategy_id == bindparam("strategy_id"))
+)
+_ACTIVE_STRATEGIES_FOR_ACCOUNT = lambda_stmt(
+    lambda: select(Strategy)
+    .where(
+        Strategy.account_name == bindparam("account_name"),
+        func.coalesce(Strategy.valid_until_utc, literal_column("'infinity'::timestamptz"))
+        > bindparam("now"),
+    )
+    .order_by(Strategy.created_at.desc())
+)
+# Account ID with each of its active strategies, newest first; a single row with
+# no strategy if the account has none, and no rows if the account doesn't exist
+_ACCOUNT_WITH_ACTIVE_STRATEGIES = lambda_stmt(
+    lambda: select(Account.account_id, Strategy)
+    .outerjoin(
+        Strategy,
+        and_(
+            Strategy.account_name == Account.account_name,
+            func.coalesce(Strategy.valid_until_utc, literal_column("'infinity'::timestamptz"))
+            > bindparam("now"),
+        ),
+    )
+    .where(Account.account_name == bindparam("account_name"))
+    .order_by(Strategy.created_at.desc())
+)
+# Account ID plus whether it already has an active strategy for a ticker; no row
+# if the account doesn't exist
+_ACCOUNT_HAS_ACTIVE_STRATEGY_FOR_TICKER = lambda_stmt(
+    lambda: select(
+        Account.account_id,
+        select(Strategy.strategy_id)
+        .where(
+            Strategy.account_name == bindparam("account_name"),
+            Strategy.ticker == bindparam("ticker"),
+            func.coalesce(Strategy.valid_until_utc, literal_column("'infinity'::timestamptz"))
+            > bindparam("now"),
+        )
+        .exists()
+        .label("has_active_strategy"),
+    ).where(Account.account_name == bindparam("account_name"))
+)
+# Account ID and position for an account and ticker; position is NULL if none is held
+_ACCOUNT_POSITION_FOR_TICKER = lambda_stmt(
+    lambda: select(Account.account_id, KalshiPosition.position)
+    .outerjoin(
+        KalshiPosition,
+        and_(
+            KalshiPosition.account_id == Account.account_id,
+            KalshiPosition.ticker == bindparam("ticker"),
+        ),
+    )
+    .where(Account.account_name == bindparam("account_name"))
+)
+_OPEN_KALSHI_ORDER_ID = lambda_stmt(
+    lambda: select(KalshiOrder.order_id).where(
+        KalshiOrder.account_id == bindparam("account_id"),
+        KalshiOrder.ticker == bindparam("ticker"),
+        KalshiOrder.side == bindparam("side"),
+        KalshiOrder.action == bindparam("action"),
+        KalshiOrder.status == literal_column("'OPEN'"),
+        KalshiOrder.expiration_ts > bindparam("current_ts"),
+    )
+    .limit(1)
+)
+# Ticker, side and ID of every open, non-expired order for an account with a
+# given action
+_OPEN_KALSHI_ORDERS_FOR_ACCOUNT = lambda_stmt(
+    lambda: select(KalshiOrder.ticker, KalshiOrder.side, KalshiOrder.order_id).where(
+        KalshiOrder.account_id == bindparam("account_id"),
+        KalshiOrder.action == bindparam("action"),
+        KalshiOrder.status == literal_column("'OPEN'"),
+        KalshiOrder.expiration_ts > bindparam("current_ts"),
+    )
+)
+
+
+def _convert_market_prices_to_decimals(raw_market_data: dict) -> dict:
     """
-    Convert raw Kalshi market data (with prices in cents) to Decimal dollars.
+    Convert the bid/ask prices of raw Kalshi market data to Decimal dollars.
+    
+    Strategy processing only reads prices, so it uses this instead of
+    _convert_market_data_to_decimals and skips parsing the timestamps.
     
     Args:
-        raw_market_data: Raw market data from Kalshi API with integer cent prices
+        raw_market_data: Raw market data from Kalshi API with *_dollars price fields
         
     Returns:
-        Dictionary with prices converted to Decimal dollars and other fields preserved
+        Dictionary of yes_bid, yes_ask, no_bid and no_ask as Decimal dollars (or None)
     """
     # Use dollar fields directly from API if available, otherwise convert cents to dollars
     yes_bid_dollars = raw_market_data.get('yes_bid_dollars')
@@ -39,12 +145,37 @@ def _convert_market_data_to_decimals(raw_market_data: dict) -> dict:
         'yes_ask': Decimal(str(yes_ask_dollars)) if yes_ask_dollars is not None else None,
         'no_bid': Decimal(str(no_bid_dollars)) if no_bid_dollars is not None else None,
         'no_ask': Decimal(str(no_ask_dollars)) if no_ask_dollars is not None else None,
+    }
+
+
+def _convert_market_data_to_decimals(raw_market_data: dict) -> dict:
+    """
+    Convert raw Kalshi market data (with prices in cents) to Decimal dollars.
+    
+    Args:
+        raw_market_data: Raw market data from Kalshi API with integer cent prices
+        
+    Returns:
+        Dictionary with prices converted to Decimal dollars and other fields preserved
+    """
+    return {
+        **_convert_market_prices_to_decimals(raw_market_data),
         'status': raw_market_data.get('status'),
-        'close_time': raw_market_data.get('close_time'),
-        'expected_expiration_time': raw_market_data.get('expected_expiration_time'),
+        'close_time': _parse_timestamp(raw_market_data.get('close_time')),
+        'expected_expiration_time': _parse_timestamp(raw_market_data.get('expected_expiration_time')),
     }
 
 
+def _to_cents(price: Decimal) -> int:
+    """Convert a Decimal dollar price to whole cents, rounding half to even."""
+    return int((price * 100).quantize(_WHOLE_CENTS, rounding=ROUND_HALF_EVEN))
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp from the Kalshi API, passing None through."""
+    return datetime.fromisoformat(value) if value else None
+
+
 class CreateStrategyRequest(BaseModel):
     account_name: str
     ticker: str
@@ -80,6 +211,9 @@ class CreateStrategyResponse(BaseModel):
     notes: Optional[str] = None
     created_at: datetime
 
+    class Config:
+        from_attributes = True
+
 
 class StrategyResponse(BaseModel):
     strategy_id: str
@@ -100,6 +234,9 @@ class StrategyResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    class Config:
+        from_attributes = True
+
 
 class StrategyWithMarketDataResponse(BaseModel):
     strategy_id: str
@@ -164,10 +301,14 @@ async def create_strategy_handler(
 ) -> CreateStrategyResponse:
     """Create a new trading strategy."""
     try:
-        # Verify the account exists
-        stmt = select(Account).where(Account.account_name == request.account_name)
-        result = await db.execute(stmt)
-        account = result.scalar_one_or_none()
+        # Verify the account exists and has no active strategy for this ticker,
+        # both in one query
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            _ACCOUNT_HAS_ACTIVE_STRATEGY_FOR_TICKER,
+            {"account_name": request.account_name, "ticker": request.ticker, "now": now},
+        )
+        account = result.one_or_none()
 
         if not account:
             raise HTTPException(
@@ -175,20 +316,7 @@ async def create_strategy_handler(
                 detail=f"Account with name '{request.account_name}' not found"
             )
 
-        # Check if there's already an active strategy for this account and ticker
-        now = datetime.now(timezone.utc)
-        stmt = select(Strategy).where(
-            Strategy.account_name == request.account_name,
-            Strategy.ticker == request.ticker,
-            or_(
-                Strategy.valid_until_utc > now,
-                Strategy.valid_until_utc.is_(None),
-            ),
-        )
-        result = await db.execute(stmt)
-        existing_strategy = result.scalar_one_or_none()
-
-        if existing_strategy:
+        if account.has_active_strategy:
             raise HTTPException(
                 status_code=409,
                 detail=f"Account already has an active strategy for ticker '{request.ticker}'"
@@ -217,26 +345,8 @@ async def create_strategy_handler(
         )
         db.add(strategy)
         await db.commit()
-        await db.refresh(strategy)
 
-        return CreateStrategyResponse(
-            strategy_id=strategy.strategy_id,
-            account_name=strategy.account_name,
-            ticker=strategy.ticker,
-            side=strategy.side,
-            thesis=strategy.thesis,
-            thesis_probability=strategy.thesis_probability,
-            entry_max_price=strategy.entry_max_price,
-            entry_min_implied_edge=strategy.entry_min_implied_edge,
-            entry_max_capital_risk=strategy.entry_max_capital_risk,
-            entry_max_position_shares=strategy.entry_max_position_shares,
-            exit_take_profit_price=strategy.exit_take_profit_price,
-            exit_stop_loss_price=strategy.exit_stop_loss_price,
-            exit_time_stop_utc=strategy.exit_time_stop_utc,
-            valid_until_utc=strategy.valid_until_utc,
-            notes=strategy.notes,
-            created_at=strategy.created_at,
-        )
+        return CreateStrategyResponse.model_validate(strategy)
 
     except HTTPException:
         await db.rollback()
@@ -248,47 +358,77 @@ async def create_strategy_handler(
         )
 
 
+def _remember_active_strategy_tickers(account_name: str, tickers: frozenset[str]) -> None:
+    """Record an account's active strategy tickers, evicting the oldest account when full."""
+    _active_strategy_tickers.pop(account_name, None)
+    if len(_active_strategy_tickers) >= ACTIVE_STRATEGY_TICKERS_CACHE_MAX_SIZE:
+        del _active_strategy_tickers[next(iter(_active_strategy_tickers))]
+    _active_strategy_tickers[account_name] = tickers
+
+
 async def get_active_strategies_handler(
     account_name: str, db: AsyncSession
 ) -> GetActiveStrategiesResponse:
     """Get all active strategies for an account with current market data."""
     try:
-        # Find the account by name
-        stmt = select(Account).where(Account.account_name == account_name)
-        result = await db.execute(stmt)
-        account = result.scalar_one_or_none()
-
-        if not account:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Account with name '{account_name}' not found"
+        # Start fetching the tickers this account had last time right away, so
+        # their market data is usually ready by the time the strategies are read
+        market_tasks: list[asyncio.Task] = []
+        speculative_tickers = _active_strategy_tickers.get(account_name, frozenset())
+        if speculative_tickers:
+            market_tasks.append(
+                asyncio.create_task(fetch_cached_market_data_for_tickers(list(speculative_tickers)))
             )
+        seen_tickers = set(speculative_tickers)
+        try:
+            # Find the account by name
+            result = await db.execute(_ACCOUNT_BY_NAME, {"account_name": account_name})
+            account = result.scalar_one_or_none()
 
-        # Get active strategies (valid_until_utc > now OR valid_until_utc is null)
-        now = datetime.now(timezone.utc)
-        stmt = (
-            select(Strategy)
-            .where(
-                Strategy.account_name == account_name,
-                or_(
-                    Strategy.valid_until_utc > now,
-                    Strategy.valid_until_utc.is_(None),
-                ),
-            )
-            .order_by(Strategy.created_at.desc())
-        )
-        result = await db.execute(stmt)
-        strategies = result.scalars().all()
+            if not account:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Account with name '{account_name}' not found"
+                )
 
-        if not strategies:
-            return GetActiveStrategiesResponse(
-                account_name=account_name,
-                strategies=[]
+            # Get active strategies (valid_until_utc > now OR valid_until_utc is null),
+            # written as one COALESCE range so it can use the active-strategy index
+            # Each batch's new tickers are fetched (reusing recently fetched markets)
+            # while the following batches are still being read
+            now = datetime.now(timezone.utc)
+            strategies: list[Strategy] = []
+            result = await db.stream_scalars(
+                _ACTIVE_STRATEGIES_FOR_ACCOUNT,
+                {"account_name": account_name, "now": now},
+                execution_options={"yield_per": ACTIVE_STRATEGIES_YIELD_PER},
             )
+            async for batch in result.partitions():
+                new_tickers = {s.ticker for s in batch} - seen_tickers
+                if new_tickers:
+                    seen_tickers |= new_tickers
+                    market_tasks.append(
+                        asyncio.create_task(fetch_cached_market_data_for_tickers(list(new_tickers)))
+                    )
+                strategies.extend(batch)
 
-        # Fetch market data for all tickers
-        tickers = [s.ticker for s in strategies]
-        raw_market_data_map = await fetch_market_data_for_tickers(tickers)
+            if not strategies:
+                _active_strategy_tickers.pop(account_name, None)
+                for task in market_tasks:
+                    task.cancel()
+                return GetActiveStrategiesResponse(
+                    account_name=account_name,
+                    strategies=[]
+                )
+
+            raw_market_data_map: dict[str, dict] = {}
+            for market_data_map in await asyncio.gather(*market_tasks):
+                raw_market_data_map.update(market_data_map)
+        except BaseException:
+            for task in market_tasks:
+                task.cancel()
+            raise
+
+        _remember_active_strategy_tickers(account_name, frozenset(s.ticker for s in strategies))
 
         # Build response with market data
         strategies_with_market_data = []
@@ -311,8 +451,10 @@ async def get_active_strategies_handler(
                 if no_ask is not None:
                     current_edge = s.thesis_probability - no_ask
             
+            # Fields come from ORM rows and already-converted market data, so
+            # skip per-field validation when building each row
             strategies_with_market_data.append(
-                StrategyWithMarketDataResponse(
+                StrategyWithMarketDataResponse.model_construct(
                     strategy_id=s.strategy_id,
                     account_name=s.account_name,
                     ticker=s.ticker,
@@ -366,102 +508,74 @@ async def update_strategy_handler(
     1. Find the existing strategy
     2. Set its valid_until_utc to now (expire it)
     3. Create a new strategy with updated values and a new ID
+    
+    All three steps run as one statement: an UPDATE ... RETURNING that only
+    matches an unexpired strategy, feeding an INSERT ... SELECT of the new version.
     """
     try:
-        # Find the existing strategy
-        stmt = select(Strategy).where(Strategy.strategy_id == request.strategy_id)
-        result = await db.execute(stmt)
-        old_strategy = result.scalar_one_or_none()
+        now = datetime.now(timezone.utc)
 
-        if not old_strategy:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Strategy with id '{request.strategy_id}' not found"
+        # Expire the old strategy if it's still active, returning its values
+        old = (
+            update(Strategy.__table__)
+            .where(
+                Strategy.strategy_id == request.strategy_id,
+                func.coalesce(Strategy.valid_until_utc, literal_column("'infinity'::timestamptz"))
+                > now,
             )
+            .values(valid_until_utc=now)
+            .returning(*Strategy.__table__.c)
+            .cte("old_strategy")
+        )
 
-        now = datetime.now(timezone.utc)
+        def updated(value, column):
+            # Requested value if given, otherwise the old strategy's value
+            return old.c[column.key] if value is None else cast(value, column.type)
+
+        # Create new strategy with updated values (use old values as defaults).
+        # A new strategy starts without expiration unless specified.
+        new_values = {
+            Strategy.strategy_id: cast(str(uuid.uuid4()), Strategy.strategy_id.type),
+            Strategy.account_name: old.c.account_name,
+            Strategy.ticker: old.c.ticker,
+            Strategy.side: old.c.side,
+            Strategy.thesis: updated(request.thesis, Strategy.thesis),
+            Strategy.thesis_probability: updated(request.thesis_probability, Strategy.thesis_probability),
+            Strategy.entry_max_price: updated(request.entry_max_price, Strategy.entry_max_price),
+            Strategy.entry_min_implied_edge: old.c.entry_min_implied_edge,
+            Strategy.entry_max_capital_risk: old.c.entry_max_capital_risk,
+            Strategy.entry_max_position_shares: old.c.entry_max_position_shares,
+            Strategy.exit_take_profit_price: updated(request.exit_take_profit_price, Strategy.exit_take_profit_price),
+            Strategy.exit_stop_loss_price: updated(request.exit_stop_loss_price, Strategy.exit_stop_loss_price),
+            Strategy.exit_time_stop_utc: updated(request.exit_time_stop_utc, Strategy.exit_time_stop_utc),
+            Strategy.valid_until_utc: cast(request.valid_until_utc, Strategy.valid_until_utc.type),
+            Strategy.notes: updated(request.notes, Strategy.notes),
+        }
+        result = await db.execute(
+            insert(Strategy.__table__)
+            .from_select(list(new_values), select(*new_values.values()).select_from(old))
+            .returning(*Strategy.__table__.c)
+        )
+        new_strategy = result.one_or_none()
 
-        # Check if strategy is already expired
-        if old_strategy.valid_until_utc and old_strategy.valid_until_utc <= now:
+        if new_strategy is None:
+            # Nothing was updated; tell a missing strategy from an expired one
+            result = await db.execute(_STRATEGY_BY_ID, {"strategy_id": request.strategy_id})
+            if result.scalar_one_or_none() is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Strategy with id '{request.strategy_id}' not found"
+                )
             raise HTTPException(
                 status_code=400,
                 detail=f"Strategy '{request.strategy_id}' is already expired"
             )
 
-        # Expire the old strategy
-        old_strategy.valid_until_utc = now
-
-        # Generate new strategy ID
-        new_strategy_id = str(uuid.uuid4())
-
-        # Create new strategy with updated values (use old values as defaults)
-        new_strategy = Strategy(
-            strategy_id=new_strategy_id,
-            account_name=old_strategy.account_name,
-            ticker=old_strategy.ticker,
-            side=old_strategy.side,
-            thesis=request.thesis if request.thesis is not None else old_strategy.thesis,
-            thesis_probability=(
-                request.thesis_probability
-                if request.thesis_probability is not None
-                else old_strategy.thesis_probability
-            ),
-            entry_max_price=(
-                request.entry_max_price
-                if request.entry_max_price is not None
-                else old_strategy.entry_max_price
-            ),
-            entry_min_implied_edge=old_strategy.entry_min_implied_edge,
-            entry_max_capital_risk=old_strategy.entry_max_capital_risk,
-            entry_max_position_shares=old_strategy.entry_max_position_shares,
-            exit_take_profit_price=(
-                request.exit_take_profit_price
-                if request.exit_take_profit_price is not None
-                else old_strategy.exit_take_profit_price
-            ),
-            exit_stop_loss_price=(
-                request.exit_stop_loss_price
-                if request.exit_stop_loss_price is not None
-                else old_strategy.exit_stop_loss_price
-            ),
-            exit_time_stop_utc=(
-                request.exit_time_stop_utc
-                if request.exit_time_stop_utc is not None
-                else old_strategy.exit_time_stop_utc
-            ),
-            valid_until_utc=(
-                request.valid_until_utc
-                if request.valid_until_utc is not None
-                else None  # New strategy starts without expiration unless specified
-            ),
-            notes=request.notes if request.notes is not None else old_strategy.notes,
-        )
-
-        db.add(new_strategy)
         await db.commit()
-        await db.refresh(new_strategy)
 
         return UpdateStrategyResponse(
             old_strategy_id=request.strategy_id,
-            new_strategy=StrategyResponse(
-                strategy_id=new_strategy.strategy_id,
-                account_name=new_strategy.account_name,
-                ticker=new_strategy.ticker,
-                side=new_strategy.side,
-                thesis=new_strategy.thesis,
-                thesis_probability=new_strategy.thesis_probability,
-                entry_max_price=new_strategy.entry_max_price,
-                entry_min_implied_edge=new_strategy.entry_min_implied_edge,
-                entry_max_capital_risk=new_strategy.entry_max_capital_risk,
-                entry_max_position_shares=new_strategy.entry_max_position_shares,
-                exit_take_profit_price=new_strategy.exit_take_profit_price,
-                exit_stop_loss_price=new_strategy.exit_stop_loss_price,
-                exit_time_stop_utc=new_strategy.exit_time_stop_utc,
-                valid_until_utc=new_strategy.valid_until_utc,
-                notes=new_strategy.notes,
-                created_at=new_strategy.created_at,
-                updated_at=new_strategy.updated_at,
-            ),
+            new_strategy=StrategyResponse.model_validate(new_strategy),
         )
 
     except HTTPException:
@@ -488,8 +602,7 @@ async def remove_strategy_handler(
     """
     try:
         # Find the existing strategy
-        stmt = select(Strategy).where(Strategy.strategy_id == strategy_id)
-        result = await db.execute(stmt)
+        result = await db.execute(_STRATEGY_BY_ID, {"strategy_id": strategy_id})
         strategy = result.scalar_one_or_none()
 
         if not strategy:
@@ -512,31 +625,27 @@ async def remove_strategy_handler(
         await db.commit()
 
         # At the same time, sell all the positions related to this strategy at market price.
-        # First, get the account
-        account_stmt = select(Account).where(Account.account_name == strategy.account_name)
-        account_result = await db.execute(account_stmt)
-        account = account_result.scalar_one_or_none()
+        # First, get the account and its position for this ticker in one query
+        result = await db.execute(
+            _ACCOUNT_POSITION_FOR_TICKER,
+            {"account_name": strategy.account_name, "ticker": strategy.ticker},
+        )
+        account_position = result.one_or_none()
         
         order_id = None
-        if account:
-            # Check if there's a position for this ticker
-            position_stmt = select(KalshiPosition).where(
-                KalshiPosition.account_id == account.account_id,
-                KalshiPosition.ticker == strategy.ticker
-            )
-            position_result = await db.execute(position_stmt)
-            position = position_result.scalar_one_or_none()
+        if account_position:
+            position = account_position.position
             
             # If position exists and is non-zero, place a market sell order to close it
-            if position and position.position != 0:
+            if position:
                 # Determine side and count based on position
                 # Positive position = yes side, negative position = no side
-                if position.position > 0:
+                if position > 0:
                     side = "yes"
-                    count = position.position
+                    count = position
                 else:
                     side = "no"
-                    count = abs(position.position)
+                    count = abs(position)
                 
                 # Place market sell order to close the position
                 order_response = await create_kalshi_order(
@@ -582,9 +691,36 @@ class ProcessStrategyResult(BaseModel):
     order_id: Optional[str] = None
 
 
+async def _load_strategy_context(
+    db: AsyncSession, strategy: Strategy
+) -> tuple[uuid.UUID, int]:
+    """
+    Load the account ID and current position size for a strategy in one query.
+    
+    Returns a position size of 0 when the account holds no position in the ticker.
+    """
+    result = await db.execute(
+        _ACCOUNT_POSITION_FOR_TICKER,
+        {"account_name": strategy.account_name, "ticker": strategy.ticker},
+    )
+    row = result.one_or_none()
+    
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Account '{strategy.account_name}' not found"
+        )
+    
+    return row.account_id, row.position or 0
+
+
 async def process_strategy_handler(
     strategy: Strategy, db: AsyncSession,
-    market_data_map: dict[str, dict]
+    market_data_map: dict[str, dict],
+    account_id: uuid.UUID | None = None,
+    position_size: int | None = None,
+    now: datetime | None = None,
+    open_buy_orders: dict[tuple[str, KalshiOrderSide], uuid.UUID] | None = None,
 ) -> ProcessStrategyResult:
     """
     Process a single trading strategy and execute trades based on entry/exit rules.
@@ -604,8 +740,18 @@ async def process_strategy_handler(
     Args:
         strategy: Strategy to process
         db: Database session
-        market_data_map: Dictionary mapping ticker -> market data (prices, status, etc.)
+        market_data_map: Dictionary mapping ticker -> Decimal bid/ask prices
+        account_id: Account ID, if already known by the caller
+        position_size: Current position in the strategy's ticker, if already known
+            by the caller. Both are loaded in a single query when not given.
+        now: Time the processing run is evaluated at, so every strategy in a sweep
+            uses the same timestamp. Defaults to the current time.
+        open_buy_orders: IDs of the account's open, non-expired buy orders keyed by
+            (ticker, side), if already loaded by the caller. Queried when not given.
     """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    
     try:
         # 1. Get market data from the pre-fetched map
         market_data = market_data_map.get(strategy.ticker)
@@ -616,7 +762,11 @@ async def process_strategy_handler(
                 detail=f"Market data not found for ticker '{strategy.ticker}'"
             )
         
-        if strategy.side == StrategySide.YES:
+        # Resolve the side once; the order branches below reuse it
+        is_yes = strategy.side is StrategySide.YES
+        side_value = strategy.side.value  # "yes" or "no"
+        
+        if is_yes:
             ask_price = market_data['yes_ask']
             bid_price = market_data['yes_bid']
         else:
@@ -629,27 +779,11 @@ async def process_strategy_handler(
                 detail=f"Market prices not available for ticker '{strategy.ticker}' for side {strategy.side}"
             )
 
-        # 2. Get existing position for this ticker from database
-        # First get the account_id
-        account_stmt = select(Account).where(Account.account_name == strategy.account_name)
-        account_result = await db.execute(account_stmt)
-        account = account_result.scalar_one_or_none()
-        
-        if not account:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Account '{strategy.account_name}' not found"
-            )
-        
-        # Query KalshiPosition table
-        position_stmt = select(KalshiPosition).where(
-            KalshiPosition.account_id == account.account_id,
-            KalshiPosition.ticker == strategy.ticker
-        )
-        position_result = await db.execute(position_stmt)
-        kalshi_position = position_result.scalar_one_or_none()
+        # 2. Get the account and existing position for this ticker, unless the caller
+        # already loaded them
+        if account_id is None or position_size is None:
+            account_id, position_size = await _load_strategy_context(db, strategy)
         
-        position_size = kalshi_position.position if kalshi_position else 0
         position_side = StrategySide.YES if position_size >= 0 else StrategySide.NO
         
         # 3. If already have a position, check exit rules first
@@ -665,17 +799,16 @@ async def process_strategy_handler(
             if bid_price >= strategy.exit_take_profit_price:
                 # Place sell order for all shares at bid price using Kalshi API
                 # Convert price from dollars to cents for Kalshi API
-                price_cents = int(round(float(bid_price) * 100))
+                price_cents = _to_cents(bid_price)
                 
                 # Determine which price field to use based on strategy side
-                yes_price = price_cents if strategy.side == StrategySide.YES else None
-                no_price = price_cents if strategy.side == StrategySide.NO else None
+                yes_price, no_price = (price_cents, None) if is_yes else (None, price_cents)
                 
                 order_response = await create_kalshi_order(
                     db=db,
                     account_name=strategy.account_name,
                     ticker=strategy.ticker,
-                    side=strategy.side.value,  # "yes" or "no"
+                    side=side_value,
                     action="sell",
                     count=abs(position_size),  # Use absolute value for count
                     yes_price=yes_price,
@@ -703,20 +836,19 @@ async def process_strategy_handler(
                     db=db,
                     account_name=strategy.account_name,
                     ticker=strategy.ticker,
-                    side=strategy.side.value,  # "yes" or "no"
+                    side=side_value,
                     action="sell",
                     count=abs(position_size),  # Use absolute value for count
                     type="market",  # Market order for immediate execution at market price
                 )
                 
                 # Expire the strategy after stop loss is triggered
-                # Reload the strategy in the current session to ensure changes are persisted
-                strategy_stmt = select(Strategy).where(Strategy.strategy_id == strategy.strategy_id)
-                strategy_result = await db.execute(strategy_stmt)
-                strategy_to_expire = strategy_result.scalar_one()
-                
-                now = datetime.now(timezone.utc)
-                strategy_to_expire.valid_until_utc = now
+                # The strategy may belong to another session, so update it by ID
+                await db.execute(
+                    update(Strategy)
+                    .where(Strategy.strategy_id == strategy.strategy_id)
+                    .values(valid_until_utc=now)
+                )
                 await db.commit()
                 
                 return ProcessStrategyResult(
@@ -782,44 +914,47 @@ async def process_strategy_handler(
         
         # Check if there's already an open non-expired order for this strategy
         # This prevents creating duplicate orders
-        current_ts = int(datetime.now(timezone.utc).timestamp())
-        order_side = KalshiOrderSide.YES if strategy.side == StrategySide.YES else KalshiOrderSide.NO
+        current_ts = int(now.timestamp())
+        order_side = _ORDER_SIDE[strategy.side]
         
-        existing_order_stmt = select(KalshiOrder).where(
-            KalshiOrder.account_id == account.account_id,
-            KalshiOrder.ticker == strategy.ticker,
-            KalshiOrder.side == order_side,
-            KalshiOrder.action == KalshiOrderAction.BUY,
-            KalshiOrder.status == KalshiOrderStatus.OPEN,
-            KalshiOrder.expiration_ts > current_ts
-        )
-        existing_order_result = await db.execute(existing_order_stmt)
-        existing_order = existing_order_result.scalar_one_or_none()
+        if open_buy_orders is not None:
+            existing_order_id = open_buy_orders.get((strategy.ticker, order_side))
+        else:
+            existing_order_result = await db.execute(
+                _OPEN_KALSHI_ORDER_ID,
+                {
+                    "account_id": account_id,
+                    "ticker": strategy.ticker,
+                    "side": order_side,
+                    "action": KalshiOrderAction.BUY,
+                    "current_ts": current_ts,
+                },
+            )
+            existing_order_id = existing_order_result.scalar()
         
-        if existing_order:
+        if existing_order_id:
             return ProcessStrategyResult(
                 strategy_id=strategy.strategy_id,
                 ticker=strategy.ticker,
                 action="skip",
-                reason=f"Already have an open buy order (ID: {existing_order.order_id}) for this ticker and side",
+                reason=f"Already have an open buy order (ID: {existing_order_id}) for this ticker and side",
                 current_bid_price=bid_price,
                 current_ask_price=ask_price,
-                order_id=str(existing_order.order_id),
+                order_id=str(existing_order_id),
             )
         
         # Place buy order using Kalshi API
         # Convert price from dollars to cents for Kalshi API
-        price_cents = int(round(float(ask_price) * 100))
+        price_cents = _to_cents(ask_price)
         
         # Determine which price field to use based on strategy side
-        yes_price = price_cents if strategy.side == StrategySide.YES else None
-        no_price = price_cents if strategy.side == StrategySide.NO else None
+        yes_price, no_price = (price_cents, None) if is_yes else (None, price_cents)
         
         order_response = await create_kalshi_order(
             db=db,
             account_name=strategy.account_name,
             ticker=strategy.ticker,
-            side=strategy.side.value,  # "yes" or "no"
+            side=side_value,
             action="buy",
             count=size,
             yes_price=yes_price,
@@ -854,48 +989,42 @@ class ProcessStrategiesResponse(BaseModel):
     results: list[ProcessStrategyResult]
 
 
-async def process_strategies_handler(
+async def _iter_strategy_results(
     account_name: str, db: AsyncSession
-) -> ProcessStrategiesResponse:
+) -> AsyncIterator[tuple[int | None, ProcessStrategyResult]]:
     """
-    Process all active strategies for an account.
+    Process all active strategies for an account, yielding each result when ready.
     
     1. Queries all active strategies (valid_until_utc > now or null)
     2. Identifies and sells orphaned positions (non-zero positions without active strategies)
     3. Processes each active strategy in parallel using process_strategy_handler
-    4. Returns results for all strategies
+    
+    Yields (index, result) pairs, where index is the strategy's position among the
+    active strategies (newest first), or None for orphaned position sells. Strategy
+    results arrive in completion order; strategies still running when the caller
+    stops iterating are cancelled.
     """
     try:
-        # Find the account by name
-        stmt = select(Account).where(Account.account_name == account_name)
-        result = await db.execute(stmt)
-        account = result.scalar_one_or_none()
+        # Find the account and its active strategies (valid_until_utc > now OR
+        # valid_until_utc is null) in one round trip
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            _ACCOUNT_WITH_ACTIVE_STRATEGIES, {"account_name": account_name, "now": now}
+        )
+        rows = result.all()
 
-        if not account:
+        if not rows:
             raise HTTPException(
                 status_code=404,
                 detail=f"Account with name '{account_name}' not found"
             )
 
-        # Get active strategies (valid_until_utc > now OR valid_until_utc is null)
-        now = datetime.now(timezone.utc)
-        stmt = (
-            select(Strategy)
-            .where(
-                Strategy.account_name == account_name,
-                or_(
-                    Strategy.valid_until_utc > now,
-                    Strategy.valid_until_utc.is_(None),
-                ),
-            )
-            .order_by(Strategy.created_at.desc())
-        )
-        result = await db.execute(stmt)
-        strategies = result.scalars().all()
+        account_id = rows[0].account_id
+        strategies = [row.Strategy for row in rows if row.Strategy is not None]
 
         # Identify orphaned positions (non-zero positions without active strategies)
         pos_stmt = select(KalshiPosition).where(
-            KalshiPosition.account_id == account.account_id,
+            KalshiPosition.account_id == account_id,
             KalshiPosition.position != 0
         )
         pos_result = await db.execute(pos_stmt)
@@ -903,8 +1032,22 @@ async def process_strategies_handler(
         
         active_tickers = {s.ticker for s in strategies}
         orphaned_positions = [p for p in all_positions if p.ticker not in active_tickers]
+        # Strategies read their position from here instead of querying it again
+        position_by_ticker = {p.ticker: p.position for p in all_positions}
         
-        processed_results: list[ProcessStrategyResult] = []
+        # Load the account's open buy order IDs once so strategies can check for
+        # an existing order without a query each
+        orders_result = await db.execute(
+            _OPEN_KALSHI_ORDERS_FOR_ACCOUNT,
+            {
+                "account_id": account_id,
+                "action": KalshiOrderAction.BUY,
+                "current_ts": int(now.timestamp()),
+            },
+        )
+        open_buy_orders = {
+            (row.ticker, row.side): row.order_id for row in orders_result
+        }
         
         # Sell orphaned positions at market price
         for p in orphaned_positions:
@@ -921,71 +1064,90 @@ async def process_strategies_handler(
                     count=count,
                     type="market",
                 )
-                processed_results.append(
-                    ProcessStrategyResult(
-                        strategy_id="orphaned",
-                        ticker=p.ticker,
-                        action="sell_orphaned",
-                        reason=f"Orphaned position found (no active strategy). Sold {count} {side} shares at market.",
-                        order_size=count,
-                        order_id=order_response.get('order_id'),
-                    )
+                orphan_result = ProcessStrategyResult(
+                    strategy_id="orphaned",
+                    ticker=p.ticker,
+                    action="sell_orphaned",
+                    reason=f"Orphaned position found (no active strategy). Sold {count} {side} shares at market.",
+                    order_size=count,
+                    order_id=order_response.get('order_id'),
                 )
             except Exception as e:
-                processed_results.append(
-                    ProcessStrategyResult(
-                        strategy_id="orphaned",
-                        ticker=p.ticker,
-                        action="error",
-                        reason=f"Failed to sell orphaned position: {str(e)}",
-                    )
+                orphan_result = ProcessStrategyResult(
+                    strategy_id="orphaned",
+                    ticker=p.ticker,
+                    action="error",
+                    reason=f"Failed to sell orphaned position: {str(e)}",
                 )
+            yield None, orphan_result
 
         if not strategies:
-            return ProcessStrategiesResponse(
-                account_name=account_name,
-                total_strategies=0,
-                results=processed_results,
-            )
+            return
+        
+        # Strategies without a position whose limits allow no shares at any price
+        # are skipped up front, without fetching their market data. Checks that
+        # depend on prices (including open buy orders, which are checked after
+        # the price rules) still run in process_strategy_handler
+        pending: list[tuple[int, Strategy]] = []
+        for i, strategy in enumerate(strategies):
+            if position_by_ticker.get(strategy.ticker, 0) == 0:
+                if strategy.entry_max_capital_risk <= 0 or strategy.entry_max_position_shares <= 0:
+                    yield i, ProcessStrategyResult(
+                        strategy_id=strategy.strategy_id,
+                        ticker=strategy.ticker,
+                        action="skip",
+                        reason=f"Calculated size is 0: max_capital_risk={strategy.entry_max_capital_risk}, max_position_shares={strategy.entry_max_position_shares}",
+                    )
+                    continue
+            pending.append((i, strategy))
+        
+        if not pending:
+            return
         
-        # Fetch market data for all tickers at once
-        tickers = [strategy.ticker for strategy in strategies]
+        # Fetch market data for the remaining tickers at once
+        tickers = [strategy.ticker for _, strategy in pending]
         raw_market_data_map = await fetch_market_data_for_tickers(tickers)
         
-        # Convert all market data to Decimal format
+        # Convert the prices strategies read to Decimal format
         market_data_map = {
-            ticker: _convert_market_data_to_decimals(raw_data)
+            ticker: _convert_market_prices_to_decimals(raw_data)
             for ticker, raw_data in raw_market_data_map.items()
         }
         
         # Process each strategy in parallel with separate sessions
         # Each strategy gets its own session to avoid concurrent commit/rollback conflicts
+        semaphore = asyncio.Semaphore(STRATEGY_PROCESSING_CONCURRENCY)
+        
         async def process_with_new_session(strategy: Strategy) -> ProcessStrategyResult:
-            async with database.async_session_maker() as strategy_db:
-                return await process_strategy_handler(strategy, strategy_db, market_data_map)
-
-        tasks = [process_with_new_session(strategy) for strategy in strategies]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Convert exceptions to error results
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(
-                    ProcessStrategyResult(
-                        strategy_id=strategies[i].strategy_id,
-                        ticker=strategies[i].ticker,
-                        action="error",
-                        reason=str(result),
-                    )
+            async with semaphore, database.async_session_maker() as strategy_db:
+                return await process_strategy_handler(
+                    strategy, strategy_db, market_data_map,
+                    account_id=account_id,
+                    position_size=position_by_ticker.get(strategy.ticker, 0),
+                    now=now,
+                    open_buy_orders=open_buy_orders,
                 )
-            else:
-                processed_results.append(result)
 
-        return ProcessStrategiesResponse(
-            account_name=account_name,
-            total_strategies=len(strategies),
-            results=processed_results,
-        )
+        # Each task converts its own failure to an error result, so one failing
+        # strategy doesn't affect the others
+        async def run_strategy(i: int, strategy: Strategy) -> tuple[int, ProcessStrategyResult]:
+            try:
+                return i, await process_with_new_session(strategy)
+            except Exception as e:
+                return i, ProcessStrategyResult(
+                    strategy_id=strategy.strategy_id,
+                    ticker=strategy.ticker,
+                    action="error",
+                    reason=str(e),
+                )
+
+        tasks = [asyncio.create_task(run_strategy(i, strategy)) for i, strategy in pending]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
 
     except HTTPException:
         raise
@@ -994,3 +1156,53 @@ async def process_strategies_handler(
             status_code=500,
             detail=f"Failed to process strategies: {str(e)}"
         )
+
+
+async def process_strategies_handler(
+    account_name: str, db: AsyncSession
+) -> ProcessStrategiesResponse:
+    """
+    Process all active strategies for an account.
+    
+    Returns orphaned position sells first, then one result per active strategy in
+    the order the strategies were loaded.
+    """
+    orphan_results: list[ProcessStrategyResult] = []
+    strategy_results: dict[int, ProcessStrategyResult] = {}
+    async for i, result in _iter_strategy_results(account_name, db):
+        if i is None:
+            orphan_results.append(result)
+        else:
+            strategy_results[i] = result
+
+    return ProcessStrategiesResponse(
+        account_name=account_name,
+        total_strategies=len(strategy_results),
+        results=orphan_results + [strategy_results[i] for i in sorted(strategy_results)],
+    )
+
+
+async def stream_process_strategies_handler(
+    account_name: str, db: AsyncSession
+) -> StreamingResponse:
+    """
+    Process all active strategies for an account, streaming results as NDJSON.
+    
+    Each line is one ProcessStrategyResult, written as soon as it is ready, so
+    callers can act on fast strategies while slow ones are still running.
+    """
+    results = _iter_strategy_results(account_name, db)
+    # Wait for the first result before responding, so a missing account (or any
+    # other setup failure) is still returned as an HTTP error
+    first = await anext(results, None)
+
+    async def lines() -> AsyncIterator[str]:
+        try:
+            if first is not None:
+                yield first[1].model_dump_json() + "\n"
+            async for _, result in results:
+                yield result.model_dump_json() + "\n"
+        finally:
+            await results.aclose()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")